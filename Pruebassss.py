@@ -1,15 +1,16 @@
+import os
 import pygame
-import random
 import sys
-from collections import deque
-
-# Inicializar Pygame
-pygame.init()
+from collections import namedtuple
+from functools import partial
+import planificador
+from dibujo import get_queue_background, render_text
+from hilo_simulacion import SimulationWorker
+from perfilado import Profiler
+from puntos_control import load_checkpoint, save_checkpoint
 
 # Configuración de la pantalla
 WIDTH, HEIGHT = 1200, 800
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Simulador de Planificación de Procesos")
 
 # Colores
 BACKGROUND = (15, 15, 30)
@@ -18,446 +19,309 @@ GRAY = (100, 100, 100)
 HIGHLIGHT = (70, 130, 180)
 RED = (255, 0, 0)
 GREEN = (0, 255, 0)
-PROCESS_COLORS = [(255, 99, 71), (50, 205, 50), (65, 105, 225), (255, 215, 0), (218, 112, 214),
-                  (0, 206, 209), (255, 105, 180), (154, 205, 50), (255, 140, 0), (138, 43, 226)]
 
-# Fuentes
-font = pygame.font.Font(None, 24)
-title_font = pygame.font.Font(None, 36)
+# Pantalla y fuentes: se crean en init_display() al arrancar la interfaz, no al importar
+screen = None
+font = None
+title_font = None
+small_font = None
 
 # Constante para el botón de pantalla completa
 FULLSCREEN_BUTTON_SIZE = 30
 
-class Process:
-    def __init__(self, pid, arrival_time, burst_time):
-        self.pid = pid
-        self.arrival_time = arrival_time
-        self.burst_time = burst_time
-        self.remaining_time = burst_time
-        self.current_queue = 0
-        self.x = 0
-        self.y = 0
-        self.color = random.choice(PROCESS_COLORS)
-        self.completion_time = None
-        self.turnaround_time = None
-        self.waiting_time = None
-
-class MultilevelFeedbackQueue:
-    def __init__(self, num_queues, time_quantum, max_processes):
-        self.num_queues = num_queues
-        self.queues = [[] for _ in range(num_queues)]
-        self.time_quantum = time_quantum
-        self.current_time = 0
-        self.completed_processes = []
-        self.current_process = None
-        self.time_in_current_queue = 0
-        self.next_pid = 1
-        self.total_processes_generated = 0
-        self.max_processes = max_processes
+# Procesos completados que la interfaz conserva en memoria para la tabla
+COMPLETED_WINDOW = 1000
+
+# Punto de control de la simulación: se guarda periódicamente, con F5 y al salir de ella
+CHECKPOINT_PATH = "simulacion.ckpt"
+AUTOSAVE_INTERVAL = 30
+
+# Perfilado por fases: F3 lo activa y muestra la superposición, F4 exporta los registros
+PROFILE_PATH = "perfil.json"
+
+# La superposición tiene tamaño fijo para que su zona sea la misma en todos los frames
+PROFILER_OVERLAY_RECT = pygame.Rect(10, 10, 660, 84)
+
+# Vista de distribución de las colas (tecla V): barra de densidad sobre todo el rango de
+# tiempos restantes e histograma de la ventana ampliada (+/- para ampliar, flechas para moverla)
+DENSITY_CELLS = 100
+HISTOGRAM_BINS = 40
+DENSITY_COLOR = (255, 215, 0)
+
+# Frecuencia de la interfaz y velocidades de simulación en ticks por segundo (None = lo más rápido posible)
+FPS = 60
+SPEEDS = [10, 100, 1000, 10000, None]
+# Tiempo máximo que se simula de una vez, para no entrar en espiral tras un bloqueo o si el modelo no da abasto
+MAX_FRAME_TIME = 0.25
+
+def init_display():
+    global screen, font, title_font, small_font
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Simulador de Planificación de Procesos")
+    font = pygame.font.Font(None, 24)
+    title_font = pygame.font.Font(None, 36)
+    small_font = pygame.font.Font(None, 20)
+    return screen
+
+def format_stats(name, stats):
+    if not stats["count"]:
+        return f"{name}: -"
+    return (f"{name}: media {stats['mean']:.1f}  p50 {stats['p50']:.0f}  "
+            f"p95 {stats['p95']:.0f}  p99 {stats['p99']:.0f}")
+
+# Zona de la pantalla para el repintado parcial: nombre, rectángulo, clave del contenido
+# y función sin argumentos que la dibuja
+Region = namedtuple("Region", "name rect key draw")
+
+def draw_region(region, recorder=None):
+    # Las zonas con fase propia en el perfilador (tabla, superposición) se miden aparte
+    if recorder is not None and region.name in recorder.index:
+        recorder.mark("draw")
+        region.draw()
+        recorder.mark(region.name)
+    else:
+        region.draw()
+
+class DirtyRenderer:
+    # Repinta solo las zonas cuya clave cambió desde el frame anterior, junto con las que se
+    # solapan con ellas, y devuelve los rectángulos para pygame.display.update(). Si no
+    # cambió nada no se dibuja ni se envía nada a la pantalla.
+    def __init__(self):
+        self.keys = {}
+        self.size = None
+
+    def invalidate(self):
+        self.keys = {}
+
+    def render(self, screen, regions, recorder=None):
+        names = {region.name for region in regions}
+        if screen.get_size() != self.size or not self.keys or not names.issuperset(self.keys):
+            # Primer frame, cambio de tamaño o zona que desaparece: escena completa
+            self.size = screen.get_size()
+            dirty = regions
+            screen.fill(BACKGROUND)
+            rects = [screen.get_rect()]
+        else:
+            dirty = [region for region in regions
+                     if region.name not in self.keys or self.keys[region.name] != region.key]
+            if not dirty:
+                return []
+            # Las zonas que se solapan con una repintada también se repintan, para que el
+            # fondo de una no borre parte de la otra
+            dirty_rects = [region.rect for region in dirty]
+            grown = True
+            while grown:
+                grown = False
+                for region in regions:
+                    if region not in dirty and region.rect.collidelist(dirty_rects) != -1:
+                        dirty.append(region)
+                        dirty_rects.append(region.rect)
+                        grown = True
+            dirty = [region for region in regions if region in dirty]
+            for region in dirty:
+                screen.fill(BACKGROUND, region.rect)
+            rects = [region.rect for region in dirty]
+
+        self.keys = {region.name: region.key for region in regions}
+        for region in dirty:
+            draw_region(region, recorder)
+        return rects
+
+class SimulationView:
+    # Dibujo e interacción comunes a todos los planificadores: las colas se dibujan a partir
+    # de las políticas de cada nivel, así que sirve para cualquier número de niveles
+    title = "Simulador de Colas Multinivel con Retroalimentación"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, completed_window=COMPLETED_WINDOW, track_metrics=True,
+                         track_queues=True, **kwargs)
         self.show_completed = False
         self.scroll_offset = 0
         self.max_scroll = 0
-        self.is_paused = False
         self.is_fullscreen = False
+        self.queue_view = "processes"
+        self.zoom_range = None
+        self.zoom_limit = 1
+
+    def regions(self, screen, snapshot):
+        # Zonas de la escena en orden de dibujo. La clave de cada zona reúne todo lo que
+        # determina su contenido: si no cambia entre dos frames, la zona no se repinta
+        # (ver DirtyRenderer).
+        screen_width, screen_height = screen.get_size()
 
-    def generate_process(self):
-        if self.total_processes_generated < self.max_processes and random.random() < 0.1:
-            burst_time = random.randint(5, 50)
-            new_process = Process(self.next_pid, self.current_time, burst_time)
-            self.queues[0].append(new_process)
-            self.next_pid += 1
-            self.total_processes_generated += 1
+        title = render_text(title_font, self.title, WHITE)
+        regions = [Region("title", title.get_rect(midtop=(screen_width // 2, 20)), None,
+                          partial(screen.blit, title, (screen_width // 2 - title.get_width() // 2, 20)))]
 
-    def update(self):
-        if self.is_paused:
-            return
-
-        self.generate_process()
-
-        if self.current_process:
-            self.current_process.remaining_time -= 1
-            self.time_in_current_queue += 1
-            
-            if self.current_process.remaining_time == 0:
-                self.current_process.completion_time = self.current_time
-                self.current_process.turnaround_time = self.current_time - self.current_process.arrival_time
-                self.current_process.waiting_time = self.current_process.turnaround_time - self.current_process.burst_time
-                self.completed_processes.append(self.current_process)
-                self.current_process = None
-                self.time_in_current_queue = 0
-            elif self.time_in_current_queue >= self.time_quantum[self.current_process.current_queue]:
-                if self.current_process.current_queue < self.num_queues - 1:
-                    self.current_process.current_queue += 1
-                self.queues[self.current_process.current_queue].append(self.current_process)
-                self.current_process = None
-                self.time_in_current_queue = 0
-
-        if not self.current_process:
-            for q in range(self.num_queues):
-                if self.queues[q]:
-                    self.current_process = self.queues[q].pop(0)
-                    self.time_in_current_queue = 0
-                    break
-
-        self.current_time += 1
-
-    def draw(self, screen):
-        screen_width, screen_height = screen.get_size()
-        
-        # Dibujar título
-        title = title_font.render("Simulador de Colas Multinivel con Retroalimentación", True, WHITE)
-        screen.blit(title, (screen_width // 2 - title.get_width() // 2, 20))
+        summaries = snapshot.queue_summaries if self.queue_view == "distribution" else None
+        if summaries is not None:
+            # Eje común a todas las colas: de 0 al mayor tiempo restante en espera
+            self.zoom_limit = max((summary.histogram[-1][0] + 1 for summary in summaries if summary.histogram),
+                                  default=1)
+            low, high = self.zoom_range or (0, self.zoom_limit)
 
         queue_height = (screen_height - 300) // self.num_queues
         start_y = 100
-
-        for i, queue in enumerate(self.queues):
-            y_pos = start_y + i * (queue_height + 20)
-            # Dibujar fondo de la cola con gradiente
-            for j in range(queue_height):
-                alpha = 100 + (155 * j // queue_height)
-                pygame.draw.rect(screen, (*HIGHLIGHT[:3], alpha), (50, y_pos + j, screen_width - 100, 1))
-            
-            # Borde de la cola
-            pygame.draw.rect(screen, WHITE, (50, y_pos, screen_width - 100, queue_height), 2)
-            
-            # Etiqueta de la cola (dentro del recuadro)
-            text = font.render(f"Cola {i}: Quantum = {self.time_quantum[i]}", True, WHITE)
-            screen.blit(text, (60, y_pos + 10))
-
-            visible_processes = queue[:min(len(queue), 8)]
-            for j, process in enumerate(visible_processes):
-                process.x = 60 + j * 135
-                process.y = y_pos + 40
-                self.draw_process(screen, process, is_current=(process == self.current_process))
-
-            if len(queue) > 8:
-                text = font.render(f"+{len(queue) - 8} más", True, WHITE)
-                screen.blit(text, (screen_width - 150, y_pos + queue_height // 2))
-
-        if self.current_process:
-            self.draw_process(screen, self.current_process, is_current=True, bottom=True)
-
-        # Información general en un recuadro al final
-        info_rect_height = 60
-        info_rect_y = screen_height - info_rect_height - (20 if self.is_fullscreen else 0)
-        info_rect = pygame.Rect(50, info_rect_y, screen_width - 100, info_rect_height)
-        pygame.draw.rect(screen, GRAY, info_rect)
-        pygame.draw.rect(screen, WHITE, info_rect, 2)
-        
+        for i, (queue, queue_length) in enumerate(zip(snapshot.queues, snapshot.queue_lengths)):
+            queue_rect = pygame.Rect(50, start_y + i * (queue_height + 20), screen_width - 100, queue_height)
+            quantum = self.time_quantum[i]
+            label = f"Cola {i}: {self.policies[i].name} (Quantum: {'∞' if quantum == float('inf') else quantum})"
+            if snapshot.metrics and snapshot.metrics["per_queue"][i]["turnaround"]["count"]:
+                label += f" - Retorno medio: {snapshot.metrics['per_queue'][i]['turnaround']['mean']:.1f}"
+            if summaries is not None:
+                regions.append(Region(f"queue{i}", queue_rect, (label, summaries[i], low, high, self.zoom_limit),
+                                      partial(self.draw_queue_summary, screen, queue_rect, label, summaries[i],
+                                              low, high, self.zoom_limit)))
+            else:
+                regions.append(Region(f"queue{i}", queue_rect, (label, queue, queue_length),
+                                      partial(self.draw_queue, screen, queue_rect, label, queue, queue_length,
+                                              snapshot.current_process)))
+
+        running_rect = self.running_process_rect(screen)
+        regions.append(Region("running", running_rect, snapshot.current_process,
+                              partial(self.draw_running_process, screen, snapshot.current_process)))
+
+        info_rect = self.info_rect(screen)
         info_text = [
-            f"Tiempo: {self.current_time}",
-            f"Procesos generados: {self.total_processes_generated}/{self.max_processes}",
-            f"Procesos completados: {len(self.completed_processes)}"
+            f"Tiempo: {snapshot.current_time}",
+            f"Procesos generados: {snapshot.total_processes_generated}/{snapshot.max_processes}",
+            f"Procesos completados: {snapshot.completed_count}"
         ]
-        for i, text in enumerate(info_text):
-            rendered_text = font.render(text, True, WHITE)
-            screen.blit(rendered_text, (info_rect.x + 10 + i * (info_rect.width // 3), info_rect.y + 20))
-
-        # Dibujar botón para mostrar procesos completados
-        self.draw_completed_button(screen)
-
-        # Mostrar ventana de procesos completados si está activada
+        metrics_text = []
+        if snapshot.metrics:
+            info_text[2] += f" ({snapshot.metrics['throughput']:.3f}/tick)"
+            overall = snapshot.metrics["overall"]
+            metrics_text = [format_stats("Retorno", overall["turnaround"]),
+                            format_stats("Espera", overall["waiting"]),
+                            format_stats("Respuesta", overall["response"])]
+        regions.append(Region("info", info_rect, (tuple(info_text), tuple(metrics_text)),
+                              partial(self.draw_info_panel, screen, info_rect, info_text, metrics_text)))
+
+        regions.append(Region("completed_button", self.completed_button_rect(screen), None,
+                              partial(self.draw_completed_button, screen)))
+        regions.append(Region("play_pause_button", self.play_pause_button_rect(screen), snapshot.is_paused,
+                              partial(self.draw_play_pause_button, screen, snapshot.is_paused)))
+        regions.append(Region("fullscreen_button", self.fullscreen_button_rect(screen), self.is_fullscreen,
+                              partial(self.draw_fullscreen_button, screen)))
+        regions.append(Region("menu_button", self.return_to_menu_button_rect(screen), None,
+                              partial(self.draw_return_to_menu_button, screen)))
+
+        # Ventana de procesos completados, por encima del resto
         if self.show_completed:
-            self.draw_completed_processes(screen)
-
-        # Dibujar botón de play/pause
-        self.draw_play_pause_button(screen)
-
-        # Dibujar botón de pantalla completa
-        self.draw_fullscreen_button(screen)
-
-        # Dibujar botón de regreso al menú
-        self.draw_return_to_menu_button(screen)
-
-    def draw_process(self, screen, process, is_current=False, bottom=False):
-        screen_width, screen_height = screen.get_size()
-        bar_width = 120
-        bar_height = 30
-        x = process.x if not bottom else screen_width // 2 - bar_width // 2
-        y = process.y if not bottom else screen_height - 100 - (20 if self.is_fullscreen else 0)
-
-        # Dibujar barra de progreso con efecto de brillo
-        progress = (process.burst_time - process.remaining_time) / process.burst_time
-        pygame.draw.rect(screen, GRAY, (x, y, bar_width, bar_height))
-        pygame.draw.rect(screen, process.color, (x, y, int(bar_width * progress), bar_height))
-        for i in range(5):
-            highlight = (*process.color, 50 - i * 10)
-            pygame.draw.line(screen, highlight, (x, y + i), (x + int(bar_width * progress), y + i))
-
-        # Dibujar borde
-        pygame.draw.rect(screen, WHITE, (x, y, bar_width, bar_height), 1)
-        
-        # Texto del proceso
-        text = font.render(f"P{process.pid}: {process.remaining_time}", True, WHITE)
-        screen.blit(text, (x + 5, y + bar_height // 2 - text.get_height() // 2))
-        
-        if is_current and not bottom:
-            # Indicador de proceso actual en la cola
-            pygame.draw.circle(screen, WHITE, (x - 15, y + bar_height // 2), 5)
-        
-        if bottom:
-            # Información adicional para el proceso actual en la parte inferior
-            text = font.render("Proceso en ejecución", True, WHITE)
-            screen.blit(text, (x, y - 60))
-            text = font.render(f"Cola: {process.current_queue}", True, WHITE)
-            screen.blit(text, (x, y - 30))
-
-    def draw_completed_button(self, screen):
-        screen_width, screen_height = screen.get_size()
-        button_rect = pygame.Rect(screen_width - 280, screen_height - 120 - (20 if self.is_fullscreen else 0), 230, 30)
-        pygame.draw.rect(screen, HIGHLIGHT, button_rect, border_radius=5)
-        text = font.render("Ver Procesos Completados", True, WHITE)
-        text_rect = text.get_rect(center=button_rect.center)
-        screen.blit(text, text_rect)
-        return button_rect
-
-    def draw_play_pause_button(self, screen):
-        screen_width, screen_height = screen.get_size()
-        button_rect = pygame.Rect(50, screen_height - 120 - (20 if self.is_fullscreen else 0), 100, 30)
-        color = GREEN if self.is_paused else RED
-        pygame.draw.rect(screen, color, button_rect, border_radius=5)
-        text = font.render("Play" if self.is_paused else "Pause", True, WHITE)
-        text_rect = text.get_rect(center=button_rect.center)
-        screen.blit(text, text_rect)
-        return button_rect
-
-    def draw_fullscreen_button(self, screen):
-        screen_width, _ = screen.get_size()
-        button_rect = pygame.Rect(screen_width - FULLSCREEN_BUTTON_SIZE - 10, 10, FULLSCREEN_BUTTON_SIZE, FULLSCREEN_BUTTON_SIZE)
-        pygame.draw.rect(screen, WHITE, button_rect, 2)
-        if self.is_fullscreen:
-            pygame.draw.line(screen, WHITE, (button_rect.left + 5, button_rect.top + 5), (button_rect.right - 5, button_rect.bottom - 5), 2)
-            pygame.draw.line(screen, WHITE, (button_rect.left + 5, button_rect.bottom - 5), (button_rect.right - 5, button_rect.top + 5), 2)
-        else:
-            pygame.draw.rect(screen, WHITE, (button_rect.left + 5, button_rect.top + 5, button_rect.width - 10, button_rect.height - 10))
-        return button_rect
-
-    def draw_return_to_menu_button(self, screen):
-        button_rect = pygame.Rect(10, 10, 100, 30)
-        pygame.draw.rect(screen, HIGHLIGHT, button_rect, border_radius=5)
-        text = font.render("Menú", True, WHITE)
-        text_rect = text.get_rect(center=button_rect.center)
-        screen.blit(text, text_rect)
-        return button_rect
-
-    def draw_completed_processes(self, screen):
-        screen_width, screen_height = screen.get_size()
-        window_rect = pygame.Rect(screen_width // 4, screen_height // 4, screen_width // 2, screen_height // 2)
-        pygame.draw.rect(screen, GRAY, window_rect)
-        pygame.draw.rect(screen, WHITE, window_rect, 2)
-
-        title = font.render("Procesos Completados", True, WHITE)
-        screen.blit(title, (window_rect.x + 10, window_rect.y + 10))
-
-        # Definir las columnas y sus anchos
-        headers = ["PID", "Llegada", "Ráfaga", "Finalización", "Retorno", "Espera"]
-        column_widths = [40, 70, 70, 100, 70, 70]
-        total_width = sum(column_widths)
-
-        # Ajustar los anchos de las columnas para que ocupen todo el espacio disponible
-        scale_factor = (window_rect.width - 40) / total_width
-        column_widths = [int(width * scale_factor) for width in column_widths]
-
-        # Dibujar encabezados
-        x_offset = window_rect.x + 10
-        for header, width in zip(headers, column_widths):
-            text = font.render(header, True, WHITE)
-            screen.blit(text, (x_offset, window_rect.y + 40))
-            x_offset += width
-
-        # Dibujar línea separadora
-        pygame.draw.line(screen, WHITE, (window_rect.x + 10, window_rect.y + 65), 
-                         (window_rect.right - 10, window_rect.y + 65), 2)
-
-        # Crear una superficie para el contenido con scroll
-        content_height = max(window_rect.height - 100, 
- len(self.completed_processes) * 30 + 10)
-        content_surface = pygame.Surface((window_rect.width - 20, content_height))
-        content_surface.fill(GRAY)
-
-        # Dibujar datos de procesos
-        for i, process in enumerate(self.completed_processes):
-            y_pos = i * 30 - self.scroll_offset
-            if 0 <= y_pos < content_height:
-                x_offset = 10
-                data = [
-                    str(process.pid),
-                    str(process.arrival_time),
-                    str(process.burst_time),
-                    str(process.completion_time),
-                    str(process.turnaround_time),
-                    str(process.waiting_time)
-                ]
-                for value, width in zip(data, column_widths):
-                    text = font.render(value, True, WHITE)
-                    content_surface.blit(text, (x_offset, y_pos))
-                    x_offset += width
-
-        # Dibujar la superficie de contenido en la ventana
-        screen.blit(content_surface, 
-                    (window_rect.x + 10, window_rect.y + 70),
-                    (0, 0, window_rect.width - 20, window_rect.height - 80))
-
-        # Dibujar la barra de desplazamiento
-        if content_height > window_rect.height - 80:
-            scroll_height = (window_rect.height - 80) * (window_rect.height - 80) / content_height
-            scroll_pos = (window_rect.height - 80 - scroll_height) * self.scroll_offset / (content_height - window_rect.height + 80)
-            pygame.draw.rect(screen, WHITE, (window_rect.right - 20, window_rect.y + 70 + scroll_pos, 10, scroll_height))
-
-        self.max_scroll = max(0, content_height - window_rect.height + 80)
-
-    def handle_scroll(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 4:  # Scroll up
-                self.scroll_offset = max(0, self.scroll_offset - 30)
-            elif event.button == 5:  # Scroll down
-                self.scroll_offset = min(self.max_scroll, self.scroll_offset + 30)
-
-class MultiQueueMultiAlgorithm:
-    def __init__(self, time_quantum, max_processes):
-        self.queues = [deque(), deque(), deque()]  # RR, SJF, FCFS
-        self.time_quantum = time_quantum
-        self.current_time = 0
-        self.completed_processes = []
-        self.current_process = None
-        self.time_in_current_queue = 0
-        self.next_pid = 1
-        self.total_processes_generated = 0
-        self.max_processes = max_processes
-        self.show_completed = False
-        self.scroll_offset = 0
-        self.max_scroll = 0
-        self.is_paused = False
-        self.is_fullscreen = False
-
-    def generate_process(self):
-        if self.total_processes_generated < self.max_processes and random.random() < 0.1:
-            burst_time = random.randint(5, 50)
-            new_process = Process(self.next_pid, self.current_time, burst_time)
-            self.queues[0].append(new_process)
-            self.next_pid += 1
-            self.total_processes_generated += 1
-
-    def update(self):
-        if self.is_paused:
+            regions.append(Region("table", self.completed_window_rect(screen),
+                                  (snapshot.completed_count, snapshot.completed_rows, self.scroll_offset),
+                                  partial(self.draw_completed_processes, screen, snapshot)))
+        return regions
+
+    def draw(self, screen, snapshot, recorder=None):
+        # Dibujo completo de la escena (el fondo lo pinta quien llama)
+        for region in self.regions(screen, snapshot):
+            draw_region(region, recorder)
+
+    def draw_queue(self, screen, queue_rect, label, queue, queue_length, current_process=None):
+        # Dibujar fondo de la cola con gradiente (pre-renderizado)
+        screen.blit(get_queue_background(queue_rect.width, queue_rect.height), queue_rect.topleft)
+
+        # Borde de la cola
+        pygame.draw.rect(screen, WHITE, queue_rect, 2)
+
+        # Etiqueta de la cola (dentro del recuadro)
+        text = render_text(font, label, WHITE)
+        screen.blit(text, (queue_rect.x + 10, queue_rect.y + 10))
+
+        for j, process in enumerate(queue):
+            self.draw_process(screen, process, queue_rect.x + 10 + j * 135, queue_rect.y + 40,
+                              is_current=(process == current_process))
+
+        if queue_length > len(queue):
+            text = render_text(font, f"+{queue_length - len(queue)} más", WHITE)
+            screen.blit(text, (queue_rect.right - 100, queue_rect.y + queue_rect.height // 2))
+
+    def draw_queue_summary(self, screen, queue_rect, label, summary, low, high, limit):
+        # Vista agregada de la cola, dibujada solo a partir de su histograma: el coste depende
+        # del número de tiempos restantes distintos, no de la longitud de la cola
+        screen.blit(get_queue_background(queue_rect.width, queue_rect.height), queue_rect.topleft)
+        pygame.draw.rect(screen, WHITE, queue_rect, 2)
+        text = render_text(font, label, WHITE)
+        screen.blit(text, (queue_rect.x + 10, queue_rect.y + 10))
+        text = render_text(small_font, f"{summary.count} procesos - trabajo pendiente: {summary.total_remaining}"
+                                       f" - ventana [{low}, {high})", WHITE)
+        screen.blit(text, (queue_rect.right - text.get_width() - 10, queue_rect.y + 12))
+
+        x = queue_rect.x + 10
+        width = queue_rect.width - 20
+
+        # Barra de densidad sobre todo el rango, más intensa donde se acumulan más procesos
+        strip_y = queue_rect.y + 34
+        cells = [0] * DENSITY_CELLS
+        for remaining_time, count in summary.histogram:
+            cells[min(remaining_time * DENSITY_CELLS // limit, DENSITY_CELLS - 1)] += count
+        peak = max(cells) or 1
+        pygame.draw.rect(screen, BACKGROUND, (x, strip_y, width, 10))
+        for i, count in enumerate(cells):
+            if count:
+                cell_x = x + i * width // DENSITY_CELLS
+                color = tuple(base + (target - base) * count // peak
+                              for base, target in zip(BACKGROUND, DENSITY_COLOR))
+                pygame.draw.rect(screen, color, (cell_x, strip_y, x + (i + 1) * width // DENSITY_CELLS - cell_x, 10))
+        pygame.draw.rect(screen, WHITE, (x, strip_y, width, 10), 1)
+        # Ventana ampliada
+        pygame.draw.rect(screen, GREEN, (x + low * width // limit, strip_y - 2,
+                                         max(2, (min(high, limit) - low) * width // limit), 14), 1)
+
+        # Histograma de la ventana
+        chart_bottom = queue_rect.bottom - 8
+        chart_height = chart_bottom - (strip_y + 18)
+        if chart_height <= 0:
             return
-
-        self.generate_process()
-
-        if self.current_process:
-            self.current_process.remaining_time -= 1
-            self.time_in_current_queue += 1
-
-            if self.current_process.remaining_time == 0:
-                self.complete_process(self.current_process)
-                self.current_process = None
-                self.time_in_current_queue = 0
-            elif self.time_in_current_queue >= self.time_quantum[self.current_process.current_queue]:
-                if self.current_process.current_queue < len(self.queues) - 1:
-                    self.current_process.current_queue += 1
-                self.queues[self.current_process.current_queue].append(self.current_process)
-                self.current_process = None
-                self.time_in_current_queue = 0
-
-        if not self.current_process:
-            for i, queue in enumerate(self.queues):
-                if queue:
-                    if i == 0:  # Round Robin
-                        self.current_process = queue.popleft()
-                    elif i == 1:  # SJF
-                        self.current_process = min(queue, key=lambda x: x.remaining_time)
-                        queue.remove(self.current_process)
-                    else:  # FCFS
-                        self.current_process = queue.popleft()
-                    self.time_in_current_queue = 0
-                    break
-
-        self.current_time += 1
-
-    def complete_process(self, process):
-        process.completion_time = self.current_time
-        process.turnaround_time = self.current_time - process.arrival_time
-        process.waiting_time = process.turnaround_time - process.burst_time
-        self.completed_processes.append(process)
-
-    def draw(self, screen):
+        bins = [0] * HISTOGRAM_BINS
+        for remaining_time, count in summary.histogram:
+            if low <= remaining_time < high:
+                bins[(remaining_time - low) * HISTOGRAM_BINS // (high - low)] += count
+        peak = max(bins) or 1
+        for i, count in enumerate(bins):
+            if count:
+                bar_x = x + i * width // HISTOGRAM_BINS
+                bar_height = max(1, count * chart_height // peak)
+                pygame.draw.rect(screen, DENSITY_COLOR, (bar_x, chart_bottom - bar_height,
+                                                         max(1, x + (i + 1) * width // HISTOGRAM_BINS - bar_x - 2),
+                                                         bar_height))
+
+    def running_process_rect(self, screen):
+        # Barra del proceso en ejecución y sus dos líneas de texto encima
         screen_width, screen_height = screen.get_size()
-        
-        # Dibujar título
-        title = title_font.render("Simulador de Colas Multinivel con Retroalimentación y Algoritmos Diferentes", True, WHITE)
-        screen.blit(title, (screen_width // 2 - title.get_width() // 2, 20))
-
-        queue_height = (screen_height - 300) // 3
-        start_y = 100
+        y = screen_height - 100 - (20 if self.is_fullscreen else 0)
+        width = max(120, render_text(font, "Proceso en ejecución", WHITE).get_width())
+        return pygame.Rect(screen_width // 2 - 60, y - 60, width, 90)
 
-        algorithms = ["Round Robin", "Shortest Job First", "First Come First Served"]
-        for i, (queue, algorithm) in enumerate(zip(self.queues, algorithms)):
-            y_pos = start_y + i * (queue_height + 20)
-            # Dibujar fondo de la cola con gradiente
-            for j in range(queue_height):
-                alpha = 100 + (155 * j // queue_height)
-                pygame.draw.rect(screen, (*HIGHLIGHT[:3], alpha), (50, y_pos + j, screen_width - 100, 1))
-            
-            # Borde de la cola
-            pygame.draw.rect(screen, WHITE, (50, y_pos, screen_width - 100, queue_height), 2)
-            
-            # Etiqueta de la cola (dentro del recuadro)
-            quantum_text = f"Quantum: {self.time_quantum[i]}" if i < 2 else "Quantum: ∞"
-            text = font.render(f"Cola {i}: {algorithm} ({quantum_text})", True, WHITE)
-            screen.blit(text, (60, y_pos + 10))
-
-            visible_processes = list(queue)[:min(len(queue), 8)]
-            for j, process in enumerate(visible_processes):
-                process.x = 60 + j * 135
-                process.y = y_pos + 40
-                self.draw_process(screen, process, is_current=(process == self.current_process))
-
-            if len(queue) > 8:
-                text = font.render(f"+{len(queue) - 8} más", True, WHITE)
-                screen.blit(text, (screen_width - 150, y_pos + queue_height // 2))
-
-        if self.current_process:
-            self.draw_process(screen, self.current_process, is_current=True, bottom=True)
+    def draw_running_process(self, screen, process):
+        if process:
+            self.draw_process(screen, process, is_current=True, bottom=True)
 
-        # Información general en un recuadro al final
+    def info_rect(self, screen):
+        screen_width, screen_height = screen.get_size()
         info_rect_height = 60
         info_rect_y = screen_height - info_rect_height - (20 if self.is_fullscreen else 0)
-        info_rect = pygame.Rect(50, info_rect_y, screen_width - 100, info_rect_height)
+        return pygame.Rect(50, info_rect_y, screen_width - 100, info_rect_height)
+
+    def draw_info_panel(self, screen, info_rect, info_text, metrics_text):
+        # Información general en un recuadro al final
         pygame.draw.rect(screen, GRAY, info_rect)
         pygame.draw.rect(screen, WHITE, info_rect, 2)
-        
-        info_text = [
-            f"Tiempo: {self.current_time}",
-            f"Procesos generados: {self.total_processes_generated}/{self.max_processes}",
-            f"Procesos completados: {len(self.completed_processes)}"
-        ]
         for i, text in enumerate(info_text):
-            rendered_text = font.render(text, True, WHITE)
-            screen.blit(rendered_text, (info_rect.x + 10 + i * (info_rect.width // 3), info_rect.y + 20))
-
-        # Dibujar botón para mostrar procesos completados
-        self.draw_completed_button(screen)
-
-        # Mostrar ventana de procesos completados si está activada
-        if self.show_completed:
-            self.draw_completed_processes(screen)
+            rendered_text = render_text(font, text, WHITE)
+            screen.blit(rendered_text, (info_rect.x + 10 + i * (info_rect.width // 3), info_rect.y + 10))
+        for i, text in enumerate(metrics_text):
+            rendered_text = render_text(small_font, text, WHITE)
+            screen.blit(rendered_text, (info_rect.x + 10 + i * (info_rect.width // 3), info_rect.y + 36))
 
-        # Dibujar botón de play/pause
-        self.draw_play_pause_button(screen)
-
-        # Dibujar botón de pantalla completa
-        self.draw_fullscreen_button(screen)
-
-        # Dibujar botón de regreso al menú
-        self.draw_return_to_menu_button(screen)
-
-    def draw_process(self, screen, process, is_current=False, bottom=False):
+    def draw_process(self, screen, process, x=0, y=0, is_current=False, bottom=False):
         screen_width, screen_height = screen.get_size()
         bar_width = 120
         bar_height = 30
-        x = process.x if not bottom else screen_width // 2 - bar_width // 2
-        y = process.y if not bottom else screen_height - 100 - (20 if self.is_fullscreen else 0)
+        x = x if not bottom else screen_width // 2 - bar_width // 2
+        y = y if not bottom else screen_height - 100 - (20 if self.is_fullscreen else 0)
 
         # Dibujar barra de progreso con efecto de brillo
         progress = (process.burst_time - process.remaining_time) / process.burst_time
@@ -471,7 +335,7 @@ class MultiQueueMultiAlgorithm:
         pygame.draw.rect(screen, WHITE, (x, y, bar_width, bar_height), 1)
         
         # Texto del proceso
-        text = font.render(f"P{process.pid}: {process.remaining_time}", True, WHITE)
+        text = render_text(font, f"P{process.pid}: {process.remaining_time}", WHITE)
         screen.blit(text, (x + 5, y + bar_height // 2 - text.get_height() // 2))
         
         if is_current and not bottom:
@@ -480,33 +344,42 @@ class MultiQueueMultiAlgorithm:
         
         if bottom:
             # Información adicional para el proceso actual en la parte inferior
-            text = font.render("Proceso en ejecución", True, WHITE)
+            text = render_text(font, "Proceso en ejecución", WHITE)
             screen.blit(text, (x, y - 60))
-            text = font.render(f"Cola: {process.current_queue}", True, WHITE)
+            text = render_text(font, f"Cola: {process.current_queue}", WHITE)
             screen.blit(text, (x, y - 30))
 
-    def draw_completed_button(self, screen):
+    def completed_button_rect(self, screen):
         screen_width, screen_height = screen.get_size()
-        button_rect = pygame.Rect(screen_width - 280, screen_height - 120 - (20 if self.is_fullscreen else 0), 230, 30)
+        return pygame.Rect(screen_width - 280, screen_height - 120 - (20 if self.is_fullscreen else 0), 230, 30)
+
+    def draw_completed_button(self, screen):
+        button_rect = self.completed_button_rect(screen)
         pygame.draw.rect(screen, HIGHLIGHT, button_rect, border_radius=5)
-        text = font.render("Ver Procesos Completados", True, WHITE)
+        text = render_text(font, "Ver Procesos Completados", WHITE)
         text_rect = text.get_rect(center=button_rect.center)
         screen.blit(text, text_rect)
         return button_rect
 
-    def draw_play_pause_button(self, screen):
-        screen_width, screen_height = screen.get_size()
-        button_rect = pygame.Rect(50, screen_height - 120 - (20 if self.is_fullscreen else 0), 100, 30)
-        color = GREEN if self.is_paused else RED
+    def play_pause_button_rect(self, screen):
+        _, screen_height = screen.get_size()
+        return pygame.Rect(50, screen_height - 120 - (20 if self.is_fullscreen else 0), 100, 30)
+
+    def draw_play_pause_button(self, screen, is_paused):
+        button_rect = self.play_pause_button_rect(screen)
+        color = GREEN if is_paused else RED
         pygame.draw.rect(screen, color, button_rect, border_radius=5)
-        text = font.render("Play" if self.is_paused else "Pause", True, WHITE)
+        text = render_text(font, "Play" if is_paused else "Pause", WHITE)
         text_rect = text.get_rect(center=button_rect.center)
         screen.blit(text, text_rect)
         return button_rect
 
-    def draw_fullscreen_button(self, screen):
+    def fullscreen_button_rect(self, screen):
         screen_width, _ = screen.get_size()
-        button_rect = pygame.Rect(screen_width - FULLSCREEN_BUTTON_SIZE - 10, 10, FULLSCREEN_BUTTON_SIZE, FULLSCREEN_BUTTON_SIZE)
+        return pygame.Rect(screen_width - FULLSCREEN_BUTTON_SIZE - 10, 10, FULLSCREEN_BUTTON_SIZE, FULLSCREEN_BUTTON_SIZE)
+
+    def draw_fullscreen_button(self, screen):
+        button_rect = self.fullscreen_button_rect(screen)
         pygame.draw.rect(screen, WHITE, button_rect, 2)
         if self.is_fullscreen:
             pygame.draw.line(screen, WHITE, (button_rect.left + 5, button_rect.top + 5), (button_rect.right - 5, button_rect.bottom - 5), 2)
@@ -515,21 +388,30 @@ class MultiQueueMultiAlgorithm:
             pygame.draw.rect(screen, WHITE, (button_rect.left + 5, button_rect.top + 5, button_rect.width - 10, button_rect.height - 10))
         return button_rect
 
+    def return_to_menu_button_rect(self, screen):
+        return pygame.Rect(10, 10, 100, 30)
+
     def draw_return_to_menu_button(self, screen):
-        button_rect = pygame.Rect(10, 10, 100, 30)
+        button_rect = self.return_to_menu_button_rect(screen)
         pygame.draw.rect(screen, HIGHLIGHT, button_rect, border_radius=5)
-        text = font.render("Menú", True, WHITE)
+        text = render_text(font, "Menú", WHITE)
         text_rect = text.get_rect(center=button_rect.center)
         screen.blit(text, text_rect)
         return button_rect
 
-    def draw_completed_processes(self, screen):
+    def completed_window_rect(self, screen):
         screen_width, screen_height = screen.get_size()
-        window_rect = pygame.Rect(screen_width // 4, screen_height // 4, screen_width // 2, screen_height // 2)
+        return pygame.Rect(screen_width // 4, screen_height // 4, screen_width // 2, screen_height // 2)
+
+    def draw_completed_processes(self, screen, snapshot):
+        window_rect = self.completed_window_rect(screen)
         pygame.draw.rect(screen, GRAY, window_rect)
         pygame.draw.rect(screen, WHITE, window_rect, 2)
 
-        title = font.render("Procesos Completados", True, WHITE)
+        title_text = "Procesos Completados"
+        if snapshot.completed_rows < snapshot.completed_count:
+            title_text += f" (últimos {snapshot.completed_rows} de {snapshot.completed_count})"
+        title = render_text(font, title_text, WHITE)
         screen.blit(title, (window_rect.x + 10, window_rect.y + 10))
 
         # Definir las columnas y sus anchos
@@ -544,7 +426,7 @@ class MultiQueueMultiAlgorithm:
         # Dibujar encabezados
         x_offset = window_rect.x + 10
         for header, width in zip(headers, column_widths):
-            text = font.render(header, True, WHITE)
+            text = render_text(font, header, WHITE)
             screen.blit(text, (x_offset, window_rect.y + 40))
             x_offset += width
 
@@ -552,32 +434,33 @@ class MultiQueueMultiAlgorithm:
         pygame.draw.line(screen, WHITE, (window_rect.x + 10, window_rect.y + 65), 
                          (window_rect.right - 10, window_rect.y + 65), 2)
 
-        # Crear una superficie para el contenido con scroll
-        content_height = max(window_rect.height - 100, len(self.completed_processes) * 30 + 10)
-        content_surface = pygame.Surface((window_rect.width - 20, content_height))
-        content_surface.fill(GRAY)
+        # Tabla virtualizada: solo se dibujan las filas dentro de la ventana visible, así que
+        # el coste por frame no depende de cuántos procesos se hayan completado
+        content_height = max(window_rect.height - 100, snapshot.completed_rows * 30 + 10)
+        view_rect = pygame.Rect(window_rect.x + 10, window_rect.y + 70, window_rect.width - 20, window_rect.height - 80)
+        first_row = -(-self.scroll_offset // 30)
+        last_row = min(snapshot.completed_rows, (self.scroll_offset + view_rect.height + 29) // 30)
 
         # Dibujar datos de procesos
-        for i, process in enumerate(self.completed_processes):
-            y_pos = i * 30 - self.scroll_offset
-            if 0 <= y_pos < content_height:
-                x_offset = 10
-                data = [
-                    str(process.pid),
-                    str(process.arrival_time),
-                    str(process.burst_time),
-                    str(process.completion_time),
-                    str(process.turnaround_time),
-                    str(process.waiting_time)
-                ]
-                for value, width in zip(data, column_widths):
-                    text = font.render(value, True, WHITE)
-                    content_surface.blit(text, (x_offset, y_pos))
-                    x_offset += width
-
-        # Dibujar la superficie de contenido en la ventana
-        screen.blit(content_surface, (window_rect.x + 10, window_rect.y + 70), 
-                    (0, 0, window_rect.width - 20, window_rect.height - 80))
+        previous_clip = screen.get_clip()
+        screen.set_clip(view_rect)
+        for i in range(first_row, last_row):
+            process = snapshot.completed_processes[i]
+            y_pos = view_rect.y + i * 30 - self.scroll_offset
+            x_offset = view_rect.x + 10
+            data = [
+                str(process.pid),
+                str(process.arrival_time),
+                str(process.burst_time),
+                str(process.completion_time),
+                str(process.turnaround_time),
+                str(process.waiting_time)
+            ]
+            for value, width in zip(data, column_widths):
+                text = render_text(font, value, WHITE)
+                screen.blit(text, (x_offset, y_pos))
+                x_offset += width
+        screen.set_clip(previous_clip)
 
         # Dibujar la barra de desplazamiento
         if content_height > window_rect.height - 80:
@@ -587,6 +470,29 @@ class MultiQueueMultiAlgorithm:
 
         self.max_scroll = max(0, content_height - window_rect.height + 80)
 
+    def handle_queue_view_key(self, event):
+        # V alterna entre procesos y distribución; +/- y las flechas ajustan la ventana
+        if event.key == pygame.K_v:
+            self.queue_view = "distribution" if self.queue_view == "processes" else "processes"
+            return
+        low, high = self.zoom_range or (0, self.zoom_limit)
+        span = high - low
+        if event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+            span = max(2, span // 2)
+            center = (low + high) // 2
+            low = center - span // 2
+        elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+            low -= span // 2
+            span *= 2
+        elif event.key == pygame.K_LEFT:
+            low -= max(1, span // 4)
+        elif event.key == pygame.K_RIGHT:
+            low += max(1, span // 4)
+        else:
+            return
+        low = max(0, min(low, self.zoom_limit - span))
+        self.zoom_range = None if low <= 0 and span >= self.zoom_limit else (low, low + span)
+
     def handle_scroll(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 4:  # Scroll up
@@ -594,32 +500,83 @@ class MultiQueueMultiAlgorithm:
             elif event.button == 5:  # Scroll down
                 self.scroll_offset = min(self.max_scroll, self.scroll_offset + 30)
 
-def draw_main_menu(screen):
+class MultilevelFeedbackQueue(SimulationView, planificador.MultilevelFeedbackQueue):
+    def __init__(self, num_queues, time_quantum, max_processes, seed=None, sink=None, policies=None):
+        super().__init__(num_queues, time_quantum, max_processes, seed, sink=sink, policies=policies)
+
+class MultiQueueMultiAlgorithm(SimulationView, planificador.MultiQueueMultiAlgorithm):
+    title = "Simulador de Colas Multinivel con Retroalimentación y Algoritmos Diferentes"
+
+    def __init__(self, time_quantum, max_processes, seed=None, sink=None):
+        super().__init__(time_quantum, max_processes, seed, sink=sink)
+
+def get_speed_button_rect(screen, simulation):
+    _, screen_height = screen.get_size()
+    return pygame.Rect(160, screen_height - 120 - (20 if simulation.is_fullscreen else 0), 140, 30)
+
+def draw_speed_button(screen, simulation, speed):
+    button_rect = get_speed_button_rect(screen, simulation)
+    pygame.draw.rect(screen, HIGHLIGHT, button_rect, border_radius=5)
+    text = render_text(font, f"{speed} ticks/s" if speed else "Máx. velocidad", WHITE)
+    text_rect = text.get_rect(center=button_rect.center)
+    screen.blit(text, text_rect)
+    return button_rect
+
+def profiler_overlay_lines(profiler):
+    summary = profiler.summary()
+    frame = summary["frame"]
+    step = summary["step"]
+    lines = [f"FPS: {summary['fps']:.1f}"]
+    if frame:
+        lines.append(f"Ticks por frame: {frame['ticks']:.1f}")
+        lines.append("Frame (ms): " + "  ".join(f"{phase} {frame[phase] * 1000:.2f}"
+                                                  for phase in profiler.frames.phases))
+    if step:
+        lines.append("Paso del modelo (ms): " + "  ".join(f"{phase} {step[phase] * 1000:.2f}"
+                                                          for phase in profiler.steps.phases))
+    return tuple(lines)
+
+def draw_profiler_overlay(screen, lines):
+    # Texto distinto en cada frame: se renderiza sin pasar por la caché de texto
+    surfaces = [small_font.render(line, True, GREEN) for line in lines]
+    overlay_rect = PROFILER_OVERLAY_RECT
+    pygame.draw.rect(screen, (0, 0, 0), overlay_rect)
+    pygame.draw.rect(screen, GREEN, overlay_rect, 1)
+    for i, surface in enumerate(surfaces):
+        screen.blit(surface, (overlay_rect.x + 10, overlay_rect.y + 6 + i * 18))
+
+def draw_main_menu(screen, message=None):
     screen_width, screen_height = screen.get_size()
     screen.fill(BACKGROUND)
-    title = title_font.render("Simulador de Planificación de Procesos", True, WHITE)
+    title = render_text(title_font, "Simulador de Planificación de Procesos", WHITE)
     screen.blit(title, (screen_width // 2 - title.get_width() // 2, 100))
 
     options = [
         "1. Colas Multinivel con Retroalimentación",
         "2. Colas Multinivel con Retroalimentación (Algoritmos Diferentes)"
     ]
-    
+    if os.path.exists(CHECKPOINT_PATH):
+        options.append("3. Reanudar la simulación guardada")
+
     buttons = []
     for i, option in enumerate(options):
         button_rect = pygame.Rect(screen_width // 2 - 300, 200 + i * 60, 600, 50)
         pygame.draw.rect(screen, HIGHLIGHT, button_rect, border_radius=5)
-        text = font.render(option, True, WHITE)
+        text = render_text(font, option, WHITE)
         text_rect = text.get_rect(center=button_rect.center)
         screen.blit(text, text_rect)
         buttons.append(button_rect)
 
+    if message:
+        text = render_text(font, message, RED)
+        screen.blit(text, (screen_width // 2 - text.get_width() // 2, 220 + len(options) * 60))
+
     return buttons
 
 def get_simulation_parameters(simulation_type):
     screen_width, screen_height = screen.get_size()
     screen.fill(BACKGROUND)
-    title = title_font.render("Configuración de la Simulación", True, WHITE)
+    title = render_text(title_font, "Configuración de la Simulación", WHITE)
     screen.blit(title, (screen_width // 2 - title.get_width() // 2, 100))
 
     input_boxes = []
@@ -630,7 +587,7 @@ def get_simulation_parameters(simulation_type):
         labels = ["Quantum para Cola 0 (RR):", "Quantum para Cola 1 (SJF):", "Número de Procesos:"]
 
     for i, label in enumerate(labels):
-        text = font.render(label, True, WHITE)
+        text = render_text(font, label, WHITE)
         screen.blit(text, (screen_width // 2 - 200, 200 + i * 60))
         input_box = pygame.Rect(screen_width // 2 + 50, 195 + i * 60, 100, 32)
         pygame.draw.rect(screen, WHITE, input_box, 2)
@@ -638,7 +595,7 @@ def get_simulation_parameters(simulation_type):
 
     start_button = pygame.Rect(screen_width // 2 - 50, 200 + len(labels) * 60, 100, 40)
     pygame.draw.rect(screen, HIGHLIGHT, start_button)
-    start_text = font.render("Iniciar", True, WHITE)
+    start_text = render_text(font, "Iniciar", WHITE)
     screen.blit(start_text, (start_button.x + 25, start_button.y + 10))
 
     input_values = ["" for _ in range(len(labels))]
@@ -658,10 +615,12 @@ def get_simulation_parameters(simulation_type):
                             q1 = int(input_values[0])
                             q2 = int(input_values[1])
                             num_processes = int(input_values[2])
-                            if q1 <= q2 and num_processes > 0:
+                            if 0 < q1 <= q2 and num_processes > 0:
                                 return [q1, q2, float('inf')], num_processes
                             else:
-                                if q1 > q2:
+                                if q1 < 1:
+                                    error_message = "Los quantums deben ser positivos."
+                                elif q1 > q2:
                                     error_message = "El quantum de la Cola 0 debe ser menor o igual al de la Cola 1."
                                 else:
                                     error_message = "El número de procesos debe ser positivo."
@@ -690,37 +649,49 @@ def get_simulation_parameters(simulation_type):
         screen.blit(title, (screen_width // 2 - title.get_width() // 2, 100))
 
         for i, (label, box, value) in enumerate(zip(labels, input_boxes, input_values)):
-            text = font.render(label, True, WHITE)
+            text = render_text(font, label, WHITE)
             screen.blit(text, (screen_width // 2 - 200, 200 + i * 60))
             pygame.draw.rect(screen, WHITE, box, 2)
-            text_surface = font.render(value, True, WHITE)
+            text_surface = render_text(font, value, WHITE)
             screen.blit(text_surface, (box.x + 5, box.y + 5))
 
         pygame.draw.rect(screen, HIGHLIGHT, start_button)
         screen.blit(start_text, (start_button.x + 25, start_button.y + 10))
 
         if error_message:
-            error_text = font.render(error_message, True, RED)
+            error_text = render_text(font, error_message, RED)
             screen.blit(error_text, (screen_width // 2 - error_text.get_width() // 2, 150))
 
         pygame.display.flip()
 
     return None
 
+def toggle_pause(simulation):
+    simulation.is_paused = not simulation.is_paused
+
 def main():
     global WIDTH, HEIGHT, screen
+    init_display()
     clock = pygame.time.Clock()
     simulation = None
+    worker = None
     running = True
     main_menu = True
+    menu_message = None
     completed_button_rect = None
     play_pause_button_rect = None
     fullscreen_button_rect = None
     return_to_menu_button_rect = None
+    speed_button_rect = None
+    speed_index = 0
+    renderer = None
+    profiler = None
+    last_ticks = 0
 
     while running:
+        recorder = None
         if main_menu:
-            buttons = draw_main_menu(screen)
+            buttons = draw_main_menu(screen, menu_message)
             pygame.display.flip()
 
             for event in pygame.event.get():
@@ -739,7 +710,35 @@ def main():
                                 if time_quantum and max_processes:
                                     simulation = MultiQueueMultiAlgorithm(time_quantum, max_processes)
                                     main_menu = False
+                            elif i == 2:
+                                try:
+                                    simulation = load_checkpoint(CHECKPOINT_PATH)
+                                except (OSError, ValueError):
+                                    # Punto de control dañado o de otra versión: se descarta
+                                    menu_message = "No se pudo reanudar la simulación guardada; se ha descartado."
+                                    try:
+                                        os.remove(CHECKPOINT_PATH)
+                                    except OSError:
+                                        pass
+                                else:
+                                    simulation.is_fullscreen = False
+                                    main_menu = False
+                            if simulation:
+                                menu_message = None
+                                # El modelo avanza en su propio hilo; la interfaz solo dibuja instantáneas
+                                worker = SimulationWorker(simulation, SPEEDS[speed_index],
+                                                          publish_interval=1 / FPS, max_frame_time=MAX_FRAME_TIME,
+                                                          checkpoint_path=CHECKPOINT_PATH,
+                                                          checkpoint_interval=AUTOSAVE_INTERVAL)
+                                worker.profiler = profiler
+                                last_ticks = 0
+                                renderer = DirtyRenderer()
+                                worker.start()
         else:
+            if profiler is not None:
+                recorder = profiler.frames
+                recorder.begin()
+
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
@@ -747,42 +746,84 @@ def main():
                     if completed_button_rect and completed_button_rect.collidepoint(event.pos):
                         simulation.show_completed = not simulation.show_completed
                     elif play_pause_button_rect and play_pause_button_rect.collidepoint(event.pos):
-                        simulation.is_paused = not simulation.is_paused
+                        worker.execute(toggle_pause)
+                    elif speed_button_rect and speed_button_rect.collidepoint(event.pos):
+                        speed_index = (speed_index + 1) % len(SPEEDS)
+                        worker.speed = SPEEDS[speed_index]
                     elif fullscreen_button_rect and fullscreen_button_rect.collidepoint(event.pos):
                         simulation.is_fullscreen = not simulation.is_fullscreen
                         if simulation.is_fullscreen:
                             screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
                         else:
                             screen = pygame.display.set_mode((WIDTH, HEIGHT))
+                        renderer.invalidate()
                     elif return_to_menu_button_rect and return_to_menu_button_rect.collidepoint(event.pos):
                         main_menu = True
-                        simulation = None
                         screen = pygame.display.set_mode((WIDTH, HEIGHT))
                     elif simulation.show_completed:
                         simulation.handle_scroll(event)
                 if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
+                    if event.key == pygame.K_F5:
+                        worker.execute(lambda simulation: save_checkpoint(simulation, CHECKPOINT_PATH))
+                    elif event.key == pygame.K_F3:
+                        profiler = Profiler() if profiler is None else None
+                        worker.profiler = profiler
+                        last_ticks = worker.ticks_executed
+                        recorder = None
+                    elif event.key == pygame.K_F4 and profiler is not None:
+                        profiler.export(PROFILE_PATH)
+                    elif event.key == pygame.K_ESCAPE:
                         if simulation.is_fullscreen:
                             simulation.is_fullscreen = False
                             screen = pygame.display.set_mode((WIDTH, HEIGHT))
+                            renderer.invalidate()
                         else:
                             main_menu = True
-                            simulation = None
-
-            if simulation:
-                simulation.update()
-                screen.fill(BACKGROUND)
-                simulation.draw(screen)
-                completed_button_rect = simulation.draw_completed_button(screen)
-                play_pause_button_rect = simulation.draw_play_pause_button(screen)
-                fullscreen_button_rect = simulation.draw_fullscreen_button(screen)
-                return_to_menu_button_rect = simulation.draw_return_to_menu_button(screen)
-                pygame.display.flip()
-
-        clock.tick(10)  # Limitar a 10 FPS
+                    else:
+                        simulation.handle_queue_view_key(event)
+
+            if main_menu or not running:
+                # Al salir se guarda el estado para poder reanudarlo desde el menú
+                worker.stop()
+                save_checkpoint(simulation, CHECKPOINT_PATH)
+                worker = None
+                simulation = None
+                recorder = None
+            else:
+                if recorder is not None:
+                    recorder.mark("events")
+                snapshot = worker.snapshot
+                speed = SPEEDS[speed_index]
+                regions = simulation.regions(screen, snapshot)
+                regions.append(Region("speed_button", get_speed_button_rect(screen, simulation), speed,
+                                      partial(draw_speed_button, screen, simulation, speed)))
+                if profiler is not None:
+                    lines = profiler_overlay_lines(profiler)
+                    regions.append(Region("overlay", PROFILER_OVERLAY_RECT, lines,
+                                          partial(draw_profiler_overlay, screen, lines)))
+                # Solo se repinta y se envía a la pantalla lo que cambió; en pausa, nada
+                dirty_rects = renderer.render(screen, regions, recorder)
+                completed_button_rect = simulation.completed_button_rect(screen)
+                play_pause_button_rect = simulation.play_pause_button_rect(screen)
+                fullscreen_button_rect = simulation.fullscreen_button_rect(screen)
+                return_to_menu_button_rect = simulation.return_to_menu_button_rect(screen)
+                speed_button_rect = get_speed_button_rect(screen, simulation)
+                if recorder is not None:
+                    recorder.mark("draw")
+                if dirty_rects:
+                    pygame.display.update(dirty_rects)
+                if recorder is not None:
+                    recorder.mark("flip")
+
+        clock.tick(FPS)
+        if recorder is not None:
+            recorder.mark("wait")
+            ticks = worker.ticks_executed
+            recorder.end(ticks - last_ticks)
+            last_ticks = ticks
 
     pygame.quit()
     sys.exit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
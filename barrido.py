@@ -0,0 +1,176 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+from cache_resultados import DEFAULT_DIRECTORY, DEFAULT_MAX_BYTES, ResultCache, cache_key
+from montecarlo import run_summary
+
+# Barrido de parámetros sin interfaz: recorre la rejilla simulador x q0 x q1 x procesos x
+# semilla en paralelo y escribe una fila por configuración en cuanto termina, así que se
+# puede seguir (o interrumpir) un barrido de miles de configuraciones sin esperar al final.
+#
+#   python barrido.py --q0 1:8 --q1 2:16:2 --processes 1000 10000 --seeds 0:9 -o barrido.csv
+#
+# Los valores aceptan enteros, "inf" y rangos inicio:fin[:paso] (fin incluido). Los resúmenes
+# se guardan en la caché de resultados (cache_resultados.py), así que repetir un barrido solo
+# simula las configuraciones nuevas.
+
+SIMULATORS = ("MultilevelFeedbackQueue", "MultiQueueMultiAlgorithm")
+CONFIG_COLUMNS = ("simulator", "q0", "q1", "processes", "seed", "arrivals", "bursts")
+METRIC_COLUMNS = ("completed", "makespan", "throughput") + tuple(
+    f"{metric}_{statistic}" for metric in ("turnaround", "waiting", "response")
+    for statistic in ("mean", "p50", "p90", "p95", "p99"))
+COLUMNS = CONFIG_COLUMNS + METRIC_COLUMNS + ("elapsed", "cached")
+
+def parse_values(texts, allow_inf=False):
+    values = []
+    for text in texts:
+        if allow_inf and text == "inf":
+            values.append(float('inf'))
+        elif ":" in text:
+            start, stop, *step = (int(part) for part in text.split(":"))
+            values.extend(range(start, stop + 1, step[0] if step else 1))
+        else:
+            values.append(int(text))
+    return values
+
+def configurations(simulators, q0_values, q1_values, process_counts, seeds, arrivals=None, bursts=None):
+    for simulator, q0, q1, max_processes, seed in itertools.product(
+            simulators, q0_values, q1_values, process_counts, seeds):
+        yield (simulator, q0, q1, max_processes, seed, arrivals, bursts)
+
+def configuration_task(configuration):
+    simulator, q0, q1, max_processes, seed, arrivals, bursts = configuration
+    workload = None
+    if arrivals or bursts:
+        workload = {"arrivals": arrivals or "bernoulli", "bursts": bursts or "uniform"}
+    return simulator, (q0, q1, float('inf')), max_processes, seed, workload
+
+def configuration_key(configuration):
+    simulator, time_quantum, max_processes, seed, workload = configuration_task(configuration)
+    return cache_key("summary", simulator, list(time_quantum), max_processes, seed, workload)
+
+def run_configuration(task):
+    # task: (configuración, entrada de la caché o None)
+    configuration, cached = task
+    if cached is not None:
+        return configuration, cached["summary"], cached["elapsed"], True
+    start = time.perf_counter()
+    summary = run_summary(configuration_task(configuration))
+    return configuration, summary, time.perf_counter() - start, False
+
+def summary_row(configuration, summary, elapsed, cached=False):
+    row = dict(zip(CONFIG_COLUMNS, configuration))
+    row["completed"] = summary["completed"]
+    row["makespan"] = summary["makespan"]
+    row["throughput"] = summary["throughput"]
+    for metric in ("turnaround", "waiting", "response"):
+        for statistic, value in summary[metric].items():
+            row[f"{metric}_{statistic}"] = value
+    row["elapsed"] = round(elapsed, 4)
+    row["cached"] = int(cached)
+    return row
+
+class CSVRows:
+    def __init__(self, file):
+        self.file = file
+        self.writer = csv.DictWriter(file, COLUMNS)
+        self.writer.writeheader()
+
+    def write(self, row):
+        self.writer.writerow(row)
+        self.file.flush()
+
+class JSONLinesRows:
+    def __init__(self, file):
+        self.file = file
+
+    def write(self, row):
+        # JSON estricto: el quantum infinito se escribe "inf", como en el CSV
+        row = {column: "inf" if value == float('inf') else value for column, value in row.items()}
+        self.file.write(json.dumps(row, allow_nan=False) + "\n")
+        self.file.flush()
+
+def run_sweep(configurations, writer, workers=None, ordered=False, progress=None, cache=None):
+    # Las filas se escriben en el orden en que terminan (o en el de la rejilla con ordered).
+    # La caché solo la lee y escribe este proceso; los aciertos pasan por el pool sin simular
+    # para conservar el orden, y sin ordered se envían primero.
+    tasks = ((configuration, cache.get(configuration_key(configuration)) if cache is not None else None)
+             for configuration in configurations)
+    if cache is not None and not ordered:
+        tasks = sorted(tasks, key=lambda task: task[1] is None)
+    workers = workers or os.cpu_count()
+    written = 0
+    with Pool(workers) as pool:
+        results = (pool.imap if ordered else pool.imap_unordered)(run_configuration, tasks, chunksize=1)
+        for configuration, summary, elapsed, cached in results:
+            if cache is not None and not cached:
+                cache.put(configuration_key(configuration), {"summary": summary, "elapsed": elapsed})
+            writer.write(summary_row(configuration, summary, elapsed, cached))
+            written += 1
+            if progress is not None:
+                progress(written)
+    return written
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Barrido de configuraciones del planificador")
+    parser.add_argument("--simulator", nargs="+", choices=SIMULATORS + ("all",), default=["all"])
+    parser.add_argument("--q0", nargs="+", required=True, help="quantums de la cola 0")
+    parser.add_argument("--q1", nargs="+", required=True, help="quantums de la cola 1")
+    parser.add_argument("--processes", nargs="+", required=True, help="número de procesos por ejecución")
+    parser.add_argument("--seeds", nargs="+", default=["0"], help="semillas")
+    parser.add_argument("--arrivals", help="distribución de llegadas de carga.py (por defecto, sorteo por tick)")
+    parser.add_argument("--bursts", help="distribución de ráfagas de carga.py")
+    parser.add_argument("--workers", type=int, help="procesos en paralelo (por defecto, uno por núcleo)")
+    parser.add_argument("--ordered", action="store_true", help="escribir las filas en el orden de la rejilla")
+    parser.add_argument("--no-cache", action="store_true", help="simular todo sin leer ni escribir la caché")
+    parser.add_argument("--cache-dir", default=DEFAULT_DIRECTORY, help="directorio de la caché de resultados")
+    parser.add_argument("--cache-size", type=float, default=DEFAULT_MAX_BYTES / 2**20,
+                        help="tamaño máximo de la caché en MiB")
+    parser.add_argument("-o", "--output", help="fichero .csv o .jsonl (por defecto, CSV por la salida estándar)")
+    args = parser.parse_args(argv)
+
+    simulators = SIMULATORS if "all" in args.simulator else tuple(args.simulator)
+    try:
+        grid = (simulators, parse_values(args.q0, allow_inf=True), parse_values(args.q1, allow_inf=True),
+                parse_values(args.processes), parse_values(args.seeds))
+    except ValueError as error:
+        parser.error(f"valor no válido: {error}")
+    if any(quantum < 1 for quantum in grid[1] + grid[2]):
+        parser.error("los quantums deben ser al menos 1")
+    if any(count < 0 for count in grid[3]):
+        parser.error("el número de procesos no puede ser negativo")
+    if args.arrivals or args.bursts:
+        import carga
+        if args.arrivals and args.arrivals not in carga.ARRIVAL_DISTRIBUTIONS:
+            parser.error(f"distribución de llegadas desconocida: {args.arrivals}")
+        if args.bursts and args.bursts not in carga.BURST_DISTRIBUTIONS:
+            parser.error(f"distribución de ráfagas desconocida: {args.bursts}")
+    total = 1
+    for values in grid:
+        total *= len(values)
+
+    output = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        writer = JSONLinesRows(output) if args.output and args.output.endswith(".jsonl") else CSVRows(output)
+
+        def progress(written):
+            if written % 100 == 0 or written == total:
+                print(f"{written}/{total} configuraciones", file=sys.stderr)
+
+        cache = None if args.no_cache else ResultCache(args.cache_dir, int(args.cache_size * 2**20))
+        run_sweep(configurations(*grid, args.arrivals, args.bursts), writer, args.workers, args.ordered,
+                  progress if args.output else None, cache)
+        if cache is not None and args.output:
+            print(f"caché: {cache.hits} aciertos, {cache.misses} fallos", file=sys.stderr)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from planificador import MultiQueueMultiAlgorithm, Process, PROCESS_COLORS
+import puntos_control
+
+def build_state(queued):
+    # Estado con `queued` procesos repartidos entre las tres colas (incluida la SJF)
+    simulation = MultiQueueMultiAlgorithm([4, 8, float('inf')], queued, seed=1)
+    for pid in range(queued):
+        process = Process(pid, pid, 5 + pid % 46, PROCESS_COLORS[pid % len(PROCESS_COLORS)])
+        process.current_queue = pid % 3
+        simulation.queues[process.current_queue].append(process)
+    simulation.total_processes_generated = queued
+    simulation.next_pid = queued
+    return simulation
+
+def measure_checkpoint(queued):
+    simulation = build_state(queued)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "simulacion.ckpt")
+        start = time.perf_counter()
+        puntos_control.save_checkpoint(simulation, path)
+        save_time = time.perf_counter() - start
+        size = os.path.getsize(path)
+        start = time.perf_counter()
+        puntos_control.load_checkpoint(path)
+        load_time = time.perf_counter() - start
+    return save_time, load_time, size
+
+if __name__ == "__main__":
+    for queued in (10_000, 100_000, 1_000_000):
+        save_time, load_time, size = measure_checkpoint(queued)
+        print(f"{queued:>9} procesos en cola: guardar {save_time:.2f} s, restaurar {load_time:.2f} s, "
+              f"{size / 2**20:.1f} MiB")
@@ -0,0 +1,39 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+
+from planificador import MultilevelFeedbackQueue, Process
+from politicas import ShortestJobQueue
+
+DEPTHS = [10, 1_000, 100_000, 1_000_000]
+
+def measure_dispatch(depth, dispatches=10_000):
+    # Cola de nivel más bajo con `depth` procesos: se despacha uno y se reencola
+    # al final, como hace un proceso degradado que agota su quantum.
+    mfq = MultilevelFeedbackQueue(3, [1, 2, float('inf')], 0)
+    lowest = mfq.queues[-1]
+    lowest.extend(Process(pid, 0, 10) for pid in range(depth))
+    start = time.perf_counter()
+    for _ in range(dispatches):
+        lowest.append(mfq.select_process())
+    return (time.perf_counter() - start) / dispatches
+
+def measure_sjf_dispatch(depth, dispatches=10_000):
+    # Extracción del más corto y reinserción sobre la cola SJF
+    queue = ShortestJobQueue()
+    rng = random.Random(0)
+    for pid in range(depth):
+        queue.append(Process(pid, 0, rng.randint(5, 50)))
+    start = time.perf_counter()
+    for _ in range(dispatches):
+        queue.append(queue.popleft())
+    return (time.perf_counter() - start) / dispatches
+
+if __name__ == "__main__":
+    for depth in DEPTHS:
+        print(f"profundidad {depth:>9}: {measure_dispatch(depth) * 1e9:8.1f} ns por despacho, "
+              f"SJF {measure_sjf_dispatch(depth) * 1e9:8.1f} ns")
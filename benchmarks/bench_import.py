@@ -0,0 +1,28 @@
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Se mide en un intérprete nuevo para que ningún módulo venga ya cargado
+SNIPPET = """
+import sys, time
+start = time.perf_counter()
+import planificador
+elapsed = time.perf_counter() - start
+assert "pygame" not in sys.modules, "planificador no debe importar pygame"
+print(elapsed * 1000)
+"""
+
+def measure_import(module_snippet=SNIPPET, repeat=10):
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, "-c", module_snippet], cwd=ROOT, text=True)
+        samples.append(float(output))
+    return samples
+
+if __name__ == "__main__":
+    samples = measure_import()
+    print(f"import planificador: mediana {statistics.median(samples):.2f} ms, "
+          f"máximo {max(samples):.2f} ms ({len(samples)} repeticiones)")
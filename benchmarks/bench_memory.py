@@ -0,0 +1,27 @@
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from planificador import MultilevelFeedbackQueue, Process
+
+def measure_process_memory(count=100_000):
+    # Bytes por proceso, incluyendo los enteros que no vienen de la caché de enteros pequeños
+    tracemalloc.start()
+    processes = [Process(pid, pid * 10, 5 + pid % 46) for pid in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del processes
+    return size / count
+
+def measure_run_peak(max_processes=100_000, seed=1):
+    tracemalloc.start()
+    MultilevelFeedbackQueue(3, [4, 8, float('inf')], max_processes, seed).run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+if __name__ == "__main__":
+    print(f"memoria por proceso: {measure_process_memory():.0f} bytes")
+    print(f"pico de una ejecución de 100k procesos: {measure_run_peak() / 2**20:.1f} MiB")
@@ -0,0 +1,38 @@
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+import Pruebassss
+from dibujo import text_cache
+
+SIZES = [(1200, 800), (1920, 1080), (3840, 2160)]
+
+def measure_frame(simulation, size, frames=50):
+    # Tiempo medio de un frame completo (fondo + draw) sobre una superficie fuera de pantalla
+    screen = pygame.Surface(size)
+    snapshot = simulation.snapshot()
+    start = time.perf_counter()
+    for _ in range(frames):
+        screen.fill(Pruebassss.BACKGROUND)
+        simulation.draw(screen, snapshot)
+    return (time.perf_counter() - start) / frames
+
+if __name__ == "__main__":
+    Pruebassss.init_display()
+    simulations = [
+        Pruebassss.MultilevelFeedbackQueue(3, [3, 6, float('inf')], 200),
+        Pruebassss.MultiQueueMultiAlgorithm([3, 6, float('inf')], 200),
+    ]
+    for simulation in simulations:
+        for _ in range(500):
+            simulation.update()
+        for size in SIZES:
+            print(f"{type(simulation).__name__} {size[0]}x{size[1]}: "
+                  f"{measure_frame(simulation, size) * 1000:.2f} ms por frame")
+    cache = text_cache
+    print(f"caché de texto: {cache.hits} aciertos, {cache.misses} fallos ({cache.hit_rate():.1%})")
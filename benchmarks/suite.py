@@ -0,0 +1,216 @@
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from planificador import MultilevelFeedbackQueue, MultiQueueMultiAlgorithm, Process, PROCESS_COLORS
+from bench_dispatch import measure_sjf_dispatch
+
+# Suite reproducible de rendimiento. Todas las cargas usan semillas fijas y cada medida
+# se repite varias veces (se guarda la mediana). El resultado es un JSON con una entrada
+# por medida, que se puede comparar con uno anterior para detectar regresiones:
+#
+#   python benchmarks/suite.py -o base.json
+#   python benchmarks/suite.py --compare base.json --tolerance 0.15
+
+SEED = 1
+TIME_QUANTUM = [4, 8, float('inf')]
+SIMULATORS = {
+    "MultilevelFeedbackQueue": lambda max_processes, seed: MultilevelFeedbackQueue(
+        3, TIME_QUANTUM, max_processes, seed),
+    "MultiQueueMultiAlgorithm": lambda max_processes, seed: MultiQueueMultiAlgorithm(
+        TIME_QUANTUM, max_processes, seed),
+}
+QUEUE_DEPTHS = [10, 1_000, 100_000, 1_000_000]
+SJF_DEPTHS = [10, 1_000, 100_000, 1_000_000]
+RUN_SIZES = [1_000, 100_000, 1_000_000]
+FRAME_SIZES = [(1200, 800), (1920, 1080)]
+QUICK_LIMIT = 100_000
+
+def median_of(measure, repeats):
+    return statistics.median(measure() for _ in range(repeats))
+
+def prefilled_simulation(simulator, depth):
+    # Simulación sin llegadas nuevas con `depth` procesos esperando en la primera cola
+    simulation = SIMULATORS[simulator](0, SEED)
+    rng = random.Random(SEED)
+    simulation.queues[0].extend(Process(pid, 0, rng.randint(5, 50), PROCESS_COLORS[pid % len(PROCESS_COLORS)])
+                                for pid in range(1, depth + 1))
+    return simulation
+
+def measure_update(simulator, depth, ticks=50_000):
+    simulation = prefilled_simulation(simulator, depth)
+    update = simulation.update
+    start = time.perf_counter()
+    for _ in range(ticks):
+        update()
+    return ticks / (time.perf_counter() - start)
+
+def measure_end_to_end(simulator, max_processes):
+    simulation = SIMULATORS[simulator](max_processes, SEED)
+    start = time.perf_counter()
+    simulation.run()
+    return time.perf_counter() - start
+
+def measure_peak_memory(simulator, max_processes):
+    # Pico de memoria reservada durante la ejecución. Se mide aparte porque tracemalloc
+    # ralentiza la simulación; con semilla fija el resultado es determinista.
+    tracemalloc.start()
+    SIMULATORS[simulator](max_processes, SEED).run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+def measure_render(frames=50):
+    # Frames fuera de pantalla con el driver de vídeo ficticio de SDL. pygame se importa
+    # aquí para que el resto de la suite funcione sin él (--no-render).
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    import Pruebassss
+    Pruebassss.init_display()
+
+    results = []
+    simulations = [
+        Pruebassss.MultilevelFeedbackQueue(3, TIME_QUANTUM, 5_000, SEED),
+        Pruebassss.MultiQueueMultiAlgorithm(TIME_QUANTUM, 5_000, SEED),
+    ]
+    for simulation in simulations:
+        simulator = type(simulation).__name__
+        for _ in range(20_000):
+            simulation.advance()
+        snapshot = simulation.snapshot()
+        for size in FRAME_SIZES:
+            screen = pygame.Surface(size)
+
+            def draw():
+                start = time.perf_counter()
+                for _ in range(frames):
+                    screen.fill(Pruebassss.BACKGROUND)
+                    simulation.draw(screen, snapshot)
+                return (time.perf_counter() - start) / frames
+
+            def draw_table():
+                start = time.perf_counter()
+                for _ in range(frames):
+                    simulation.draw_completed_processes(screen, snapshot)
+                return (time.perf_counter() - start) / frames
+
+            params = {"simulator": simulator, "size": f"{size[0]}x{size[1]}",
+                      "completed": snapshot.completed_count}
+            results.append(result("frame_time.draw", params, median_of(draw, 5) * 1000, "ms"))
+            results.append(result("frame_time.completed_table", params, median_of(draw_table, 5) * 1000, "ms"))
+    return results
+
+def result(name, params, value, unit, higher_is_better=False):
+    return {"name": name, "params": params, "value": value, "unit": unit,
+            "higher_is_better": higher_is_better}
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_suite(quick=False, repeats=3, render=True):
+    limit = QUICK_LIMIT if quick else float('inf')
+    results = []
+
+    for simulator in SIMULATORS:
+        for depth in QUEUE_DEPTHS:
+            if depth <= limit:
+                ticks_per_second = median_of(lambda: measure_update(simulator, depth), repeats)
+                results.append(result("update.ticks_per_second", {"simulator": simulator, "depth": depth},
+                                      ticks_per_second, "ticks/s", higher_is_better=True))
+
+    for depth in SJF_DEPTHS:
+        if depth <= limit:
+            dispatch = median_of(lambda: measure_sjf_dispatch(depth), repeats)
+            results.append(result("sjf.dispatch", {"depth": depth}, dispatch * 1e9, "ns"))
+
+    for simulator in SIMULATORS:
+        for max_processes in RUN_SIZES:
+            if max_processes <= limit:
+                params = {"simulator": simulator, "processes": max_processes}
+                runtime = median_of(lambda: measure_end_to_end(simulator, max_processes), repeats)
+                results.append(result("run.runtime", params, runtime, "s"))
+                peak = measure_peak_memory(simulator, max_processes)
+                results.append(result("run.peak_memory", params, peak / 2**20, "MiB"))
+
+    if render:
+        results.extend(measure_render())
+
+    return {
+        "metadata": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+            "cpu_count": os.cpu_count(),
+            "revision": git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "seed": SEED,
+            "repeats": repeats,
+            "quick": quick,
+        },
+        "results": results,
+    }
+
+def result_key(entry):
+    return entry["name"], json.dumps(entry["params"], sort_keys=True)
+
+def compare(baseline, current, tolerance):
+    # Devuelve las medidas que empeoran más que `tolerance` (fracción) respecto a la base
+    previous = {result_key(entry): entry for entry in baseline["results"]}
+    regressions = []
+    for entry in current["results"]:
+        old = previous.get(result_key(entry))
+        if old is None or not old["value"]:
+            continue
+        change = (entry["value"] - old["value"]) / old["value"]
+        if entry["higher_is_better"]:
+            change = -change
+        if change > tolerance:
+            regressions.append((entry, old, change))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite de rendimiento del planificador")
+    parser.add_argument("-o", "--output", help="fichero JSON de resultados (por defecto, salida estándar)")
+    parser.add_argument("--quick", action="store_true",
+                        help=f"omite las medidas de más de {QUICK_LIMIT} procesos")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--no-render", action="store_true", help="omite las medidas de dibujo")
+    parser.add_argument("--compare", metavar="BASE", help="JSON anterior con el que comparar")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="empeoramiento relativo admitido antes de marcar una regresión")
+    args = parser.parse_args()
+
+    report = run_suite(args.quick, args.repeats, not args.no_render)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = compare(baseline, report, args.tolerance)
+        for entry, old, change in regressions:
+            print(f"REGRESIÓN {entry['name']} {entry['params']}: {old['value']:.4g} -> "
+                  f"{entry['value']:.4g} {entry['unit']} ({change:+.1%})", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+if __name__ == "__main__":
+    main()
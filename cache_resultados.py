@@ -0,0 +1,114 @@
+import hashlib
+import json
+import os
+import platform
+import tempfile
+
+# Caché en disco de resultados de simulación. Cada entrada es un JSON cuyo nombre es el
+# hash de la configuración (simulador, quantums, procesos, semilla, carga...) y de la
+# versión del motor, así que repetir un barrido o un lote ya calculado no vuelve a simular.
+# El tamaño total está acotado: al superarlo se borran las entradas usadas hace más tiempo
+# (cada acierto actualiza la fecha de modificación del fichero).
+
+DEFAULT_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache_resultados")
+DEFAULT_MAX_BYTES = 64 * 2**20
+# Al desalojar se baja hasta esta fracción del máximo para no recorrer el directorio en
+# cada escritura
+EVICTION_TARGET = 0.9
+# Ficheros de los que depende el resultado: cualquier cambio en ellos invalida la caché
+ENGINE_FILES = ("planificador.py", "politicas.py", "estadisticas.py", "carga.py", "montecarlo.py")
+
+_engine_version = None
+
+def engine_version():
+    global _engine_version
+    if _engine_version is None:
+        digest = hashlib.sha256(platform.python_version().encode())
+        root = os.path.dirname(os.path.abspath(__file__))
+        for name in ENGINE_FILES:
+            with open(os.path.join(root, name), "rb") as source:
+                digest.update(name.encode())
+                digest.update(source.read())
+        _engine_version = digest.hexdigest()
+    return _engine_version
+
+def cache_key(kind, *parts):
+    # `parts` debe ser serializable en JSON; las tuplas y las listas dan la misma clave
+    text = json.dumps([kind, engine_version(), *parts], sort_keys=True)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+class ResultCache:
+    def __init__(self, directory=DEFAULT_DIRECTORY, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.size = None  # Se calcula en la primera escritura
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key):
+        path = self.path(key)
+        try:
+            with open(path) as entry:
+                value = json.load(entry)
+            os.utime(path)
+        except (OSError, ValueError):
+            # Sin entrada, borrada por otro proceso o escrita a medias: se vuelve a calcular
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = json.dumps(value).encode()
+        # Escritura atómica: un lector concurrente nunca ve una entrada a medias
+        descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as entry:
+            entry.write(data)
+        os.replace(temporary_path, path)
+        if self.size is None:
+            self.size = sum(size for _, size, _ in self.entries())
+        else:
+            self.size += len(data)
+        if self.size > self.max_bytes:
+            self.evict()
+
+    def entries(self):
+        # (ruta, tamaño, último uso) de cada entrada
+        if not os.path.isdir(self.directory):
+            return
+        for bucket in os.scandir(self.directory):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                if entry.name.endswith(".json"):
+                    try:
+                        status = entry.stat()
+                    except OSError:
+                        continue
+                    yield entry.path, status.st_size, status.st_mtime
+
+    def evict(self):
+        entries = sorted(self.entries(), key=lambda entry: entry[2])
+        self.size = sum(size for _, size, _ in entries)
+        target = self.max_bytes * EVICTION_TARGET
+        for path, size, _ in entries:
+            if self.size <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self.size -= size
+
+    def clear(self):
+        for path, _, _ in list(self.entries()):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self.size = 0
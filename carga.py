@@ -0,0 +1,65 @@
+import numpy as np
+
+# Generación vectorizada de cargas de trabajo: todo el calendario de llegadas y el vector
+# de ráfagas de una ejecución se sortean de una vez, en lugar de un ensayo por tick.
+# Las distribuciones se registran por nombre; también se puede pasar una función propia
+# con la firma f(rng, n, **parametros) que devuelva un array de n enteros.
+
+def bernoulli_arrivals(rng, n, p=0.1):
+    # Igual que el generador por ticks: en cada tick llega un proceso con probabilidad p.
+    # Los huecos entre llegadas siguen una geométrica que empieza en 1.
+    return np.cumsum(rng.geometric(p, n)) - 1
+
+def poisson_arrivals(rng, n, rate=0.1):
+    # Proceso de Poisson de tasa `rate` por tick; varias llegadas pueden caer en el mismo tick
+    return np.floor(np.cumsum(rng.exponential(1 / rate, n))).astype(np.int64)
+
+def uniform_bursts(rng, n, low=5, high=50):
+    return rng.integers(low, high, n, endpoint=True)
+
+def exponential_bursts(rng, n, mean=27.5):
+    return np.maximum(1, np.ceil(rng.exponential(mean, n))).astype(np.int64)
+
+def lognormal_bursts(rng, n, mean=3.0, sigma=0.75):
+    return np.maximum(1, np.ceil(rng.lognormal(mean, sigma, n))).astype(np.int64)
+
+def bimodal_bursts(rng, n, short=(5, 15), long=(80, 120), long_fraction=0.2):
+    # Mezcla de trabajos interactivos cortos y trabajos por lotes largos
+    is_long = rng.random(n) < long_fraction
+    short_bursts = rng.integers(short[0], short[1], n, endpoint=True)
+    long_bursts = rng.integers(long[0], long[1], n, endpoint=True)
+    return np.where(is_long, long_bursts, short_bursts)
+
+ARRIVAL_DISTRIBUTIONS = {
+    "bernoulli": bernoulli_arrivals,
+    "poisson": poisson_arrivals,
+}
+
+BURST_DISTRIBUTIONS = {
+    "uniform": uniform_bursts,
+    "exponential": exponential_bursts,
+    "lognormal": lognormal_bursts,
+    "bimodal": bimodal_bursts,
+}
+
+def generate_workload(num_processes, arrivals="bernoulli", bursts="uniform", seed=None,
+                      arrival_params=None, burst_params=None):
+    arrival_distribution = ARRIVAL_DISTRIBUTIONS.get(arrivals, arrivals)
+    burst_distribution = BURST_DISTRIBUTIONS.get(bursts, bursts)
+    if not callable(arrival_distribution):
+        raise ValueError(f"Distribución de llegadas desconocida: {arrivals}")
+    if not callable(burst_distribution):
+        raise ValueError(f"Distribución de ráfagas desconocida: {bursts}")
+
+    # Flujos independientes para llegadas y ráfagas, como en el generador por ticks
+    arrival_seed, burst_seed = np.random.SeedSequence(seed).spawn(2)
+    arrival_times = arrival_distribution(np.random.default_rng(arrival_seed), num_processes,
+                                         **(arrival_params or {}))
+    burst_times = burst_distribution(np.random.default_rng(burst_seed), num_processes,
+                                     **(burst_params or {}))
+    return np.asarray(arrival_times, dtype=np.int64), np.asarray(burst_times, dtype=np.int64)
+
+def workload_records(arrival_times, burst_times):
+    # Flujo (llegada, ráfaga) ordenado por llegada, listo para pasar como `workload`
+    order = np.argsort(arrival_times, kind="stable")
+    return zip(arrival_times[order].tolist(), burst_times[order].tolist())
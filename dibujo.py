@@ -0,0 +1,56 @@
+from collections import OrderedDict
+import pygame
+
+# Utilidades de dibujo compartidas por las dos interfaces (Pruebassss.py y simulacion.py):
+# caché de texto renderizado y fondo de cola pre-renderizado. Solo necesitan pygame, no la
+# pantalla, así que importar este módulo no abre ninguna ventana.
+
+# Color del degradado de las colas (el HIGHLIGHT de las interfaces)
+QUEUE_COLOR = (70, 130, 180)
+
+class TextCache:
+    # Caché LRU de superficies de texto indexada por (fuente, texto, color), con contadores
+    # de aciertos y fallos para comprobar cuánto texto por frame sale de la caché.
+    def __init__(self, max_size=1024):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color):
+        key = (font, text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+text_cache = TextCache()
+
+def render_text(font, text, color):
+    return text_cache.render(font, text, color)
+
+# Fondo de cola pre-renderizado. Todas las colas tienen el mismo tamaño, así que solo se
+# guarda el del tamaño actual y se regenera al cambiar de ventana o de pantalla completa.
+queue_background_cache = {}
+
+def get_queue_background(width, height):
+    background = queue_background_cache.get((width, height))
+    if background is None:
+        queue_background_cache.clear()
+        background = pygame.Surface((width, height))
+        for j in range(height):
+            alpha = 100 + (155 * j // height)
+            pygame.draw.rect(background, (*QUEUE_COLOR, alpha), (0, j, width, 1))
+        queue_background_cache[(width, height)] = background
+    return background
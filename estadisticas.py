@@ -0,0 +1,148 @@
+import math
+from bisect import insort
+from collections import namedtuple
+
+# Estimadores en flujo de memoria constante: se actualizan con cada proceso completado y
+# nunca recorren los completados anteriores.
+
+class P2Quantile:
+    # Algoritmo P² (Jain y Chlamtac, 1985): estima un cuantil con cinco marcadores
+    def __init__(self, p):
+        self.p = p
+        self.heights = []
+        self.positions = [1, 2, 3, 4, 5]
+        self.desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self.increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, value):
+        heights = self.heights
+        if len(heights) < 5:
+            insort(heights, value)
+            return
+
+        positions = self.positions
+        if value < heights[0]:
+            heights[0] = value
+            k = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            k = 3
+        else:
+            k = 0
+            while value >= heights[k + 1]:
+                k += 1
+        for i in range(k + 1, 5):
+            positions[i] += 1
+        desired = self.desired
+        for i in range(5):
+            desired[i] += self.increments[i]
+
+        for i in (1, 2, 3):
+            delta = desired[i] - positions[i]
+            if ((delta >= 1 and positions[i + 1] - positions[i] > 1)
+                    or (delta <= -1 and positions[i - 1] - positions[i] < -1)):
+                step = 1 if delta > 0 else -1
+                height = self.parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + step * (heights[i + step] - heights[i]) / (positions[i + step] - positions[i])
+                heights[i] = height
+                positions[i] += step
+
+    def parabolic(self, i, step):
+        heights = self.heights
+        positions = self.positions
+        return heights[i] + step / (positions[i + 1] - positions[i - 1]) * (
+            (positions[i] - positions[i - 1] + step) * (heights[i + 1] - heights[i]) / (positions[i + 1] - positions[i])
+            + (positions[i + 1] - positions[i] - step) * (heights[i] - heights[i - 1]) / (positions[i] - positions[i - 1]))
+
+    def value(self):
+        if not self.heights:
+            return None
+        if len(self.heights) < 5:
+            # Con menos de cinco observaciones el cuantil se calcula de forma exacta
+            return self.heights[round((len(self.heights) - 1) * self.p)]
+        return self.heights[2]
+
+class StreamingStats:
+    # Media y varianza con el método de Welford, más cuantiles P²
+    def __init__(self, quantiles=(0.5, 0.95, 0.99)):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.quantiles = {q: P2Quantile(q) for q in quantiles}
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        for estimator in self.quantiles.values():
+            estimator.add(value)
+
+    def variance(self):
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def summary(self):
+        summary = {
+            "count": self.count,
+            "mean": self.mean if self.count else None,
+            "stddev": math.sqrt(self.variance()),
+        }
+        for q, estimator in self.quantiles.items():
+            summary[f"p{round(q * 100)}"] = estimator.value()
+        return summary
+
+METRICS = ("turnaround", "waiting", "response")
+
+class SimulationMetrics:
+    # Retorno, espera y respuesta, en global y por la cola en la que terminó cada proceso
+    def __init__(self, num_queues):
+        self.overall = {metric: StreamingStats() for metric in METRICS}
+        self.per_queue = [{metric: StreamingStats() for metric in METRICS} for _ in range(num_queues)]
+
+    def record(self, process):
+        values = (process.turnaround_time, process.waiting_time, process.response_time)
+        queue_stats = self.per_queue[process.current_queue]
+        for metric, value in zip(METRICS, values):
+            self.overall[metric].add(value)
+            queue_stats[metric].add(value)
+
+    def summary(self, current_time):
+        completed = self.overall["turnaround"].count
+        return {
+            "throughput": completed / current_time if current_time else 0.0,
+            "overall": {metric: stats.summary() for metric, stats in self.overall.items()},
+            "per_queue": [{metric: stats.summary() for metric, stats in queue.items()}
+                          for queue in self.per_queue],
+        }
+
+# Resumen inmutable de una cola para la interfaz: histogram son pares (tiempo restante,
+# número de procesos) ordenados por tiempo
+QueueSummary = namedtuple("QueueSummary", "count total_remaining histogram")
+
+class RemainingTimeHistogram:
+    # Histograma exacto del tiempo restante de los procesos de una cola, con un contador por
+    # valor distinto. Se actualiza al encolar y al desencolar (el tiempo restante no cambia
+    # mientras el proceso espera), así que resumir una cola cuesta O(valores distintos)
+    # sea cual sea su longitud y nunca hay que recorrerla.
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.total_remaining = 0
+
+    def add(self, remaining_time):
+        self.counts[remaining_time] = self.counts.get(remaining_time, 0) + 1
+        self.count += 1
+        self.total_remaining += remaining_time
+
+    def remove(self, remaining_time):
+        count = self.counts[remaining_time] - 1
+        if count:
+            self.counts[remaining_time] = count
+        else:
+            del self.counts[remaining_time]
+        self.count -= 1
+        self.total_remaining -= remaining_time
+
+    def summary(self):
+        return QueueSummary(self.count, self.total_remaining, tuple(sorted(self.counts.items())))
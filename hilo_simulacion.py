@@ -0,0 +1,107 @@
+import queue
+import threading
+import time
+
+from puntos_control import save_checkpoint
+
+class SimulationWorker(threading.Thread):
+    # Ejecuta la simulación en un hilo propio y publica instantáneas inmutables en
+    # self.snapshot. La interfaz solo lee la última instantánea y envía órdenes con
+    # execute(), de modo que ninguno de los dos espera al otro.
+    def __init__(self, simulation, speed=10, publish_interval=1 / 60, max_frame_time=0.25,
+                 checkpoint_path=None, checkpoint_interval=30):
+        super().__init__(daemon=True)
+        self.simulation = simulation
+        self.speed = speed  # Ticks por segundo; None = lo más rápido posible
+        self.publish_interval = publish_interval
+        self.max_frame_time = max_frame_time
+        self.commands = queue.Queue()
+        self.stop_event = threading.Event()
+        self.ticks_executed = 0
+        # Punto de control periódico, guardado desde este hilo entre dos pasos del modelo
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        self.snapshot = simulation.snapshot()
+        # Perfilador opcional (ver perfilado.py): tiempos de cada paso del hilo por fase
+        self.profiler = None
+
+    def execute(self, command):
+        # La orden se aplica sobre la simulación dentro del hilo de trabajo
+        self.commands.put(command)
+
+    def stop(self):
+        self.stop_event.set()
+        if self.is_alive():
+            self.join()
+
+    def apply_commands(self):
+        applied = 0
+        while True:
+            try:
+                command = self.commands.get_nowait()
+            except queue.Empty:
+                return applied
+            command(self.simulation)
+            applied += 1
+
+    def run(self):
+        accumulator = 0.0
+        last_time = time.perf_counter()
+        last_checkpoint = last_time
+        while not self.stop_event.is_set():
+            profiler = self.profiler
+            recorder = profiler.steps if profiler is not None else None
+            if recorder is not None:
+                recorder.begin()
+
+            applied = self.apply_commands()
+            if recorder is not None:
+                recorder.mark("commands")
+            now = time.perf_counter()
+            elapsed = min(now - last_time, self.max_frame_time)
+            last_time = now
+            speed = self.speed
+
+            # Una simulación terminada se trata como en pausa: seguir llamando a update()
+            # solo haría avanzar el reloj (y bajar el rendimiento medido) sin cambiar nada
+            simulation = self.simulation
+            idle = simulation.is_paused or simulation.is_finished()
+            steps = 0
+            if idle:
+                accumulator = 0.0
+            elif speed is None:
+                deadline = now + self.publish_interval / 2
+                while time.perf_counter() < deadline and not simulation.is_finished():
+                    simulation.update()
+                    steps += 1
+            else:
+                accumulator += elapsed * speed
+                steps = int(accumulator)
+                accumulator -= steps
+                for step in range(steps):
+                    if simulation.is_finished():
+                        steps = step
+                        accumulator = 0.0
+                        break
+                    simulation.update()
+            self.ticks_executed += steps
+            if recorder is not None:
+                recorder.mark("update")
+
+            # En pausa (o terminada) y sin órdenes el estado no cambia: se mantiene la
+            # instantánea anterior para que la interfaz vea las mismas claves y no repinte nada
+            if steps or applied or not idle:
+                self.snapshot = self.simulation.snapshot()
+            if recorder is not None:
+                recorder.mark("snapshot")
+
+            if self.checkpoint_path and now - last_checkpoint >= self.checkpoint_interval:
+                save_checkpoint(self.simulation, self.checkpoint_path)
+                last_checkpoint = now
+            if recorder is not None:
+                recorder.mark("checkpoint")
+                recorder.end(steps)
+
+            # Incluso a máxima velocidad se cede el GIL una parte de cada intervalo
+            # para que el hilo de la interfaz no se quede sin turno.
+            self.stop_event.wait(self.publish_interval * (0.5 if speed is None else 1))
@@ -0,0 +1,139 @@
+import os
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate
+from multiprocessing import Pool
+
+from cache_resultados import ResultCache, cache_key
+from planificador import MultilevelFeedbackQueue, MultiQueueMultiAlgorithm
+
+PERCENTILES = (50, 90, 95, 99)
+
+def create_simulation(simulator, time_quantum, max_processes, seed=None, workload=None):
+    if simulator == "MultilevelFeedbackQueue":
+        return MultilevelFeedbackQueue(len(time_quantum), list(time_quantum), max_processes, seed, workload)
+    elif simulator == "MultiQueueMultiAlgorithm":
+        return MultiQueueMultiAlgorithm(list(time_quantum), max_processes, seed, workload)
+    raise ValueError(f"Simulador desconocido: {simulator}")
+
+def prepare_simulation(task):
+    simulator, time_quantum, max_processes, seed, workload = task
+    records = None
+    if workload is not None:
+        # Carga pre-generada de una vez con NumPy (solo se importa si se usa)
+        import carga
+        records = carga.workload_records(*carga.generate_workload(max_processes, seed=seed, **workload))
+    return create_simulation(simulator, time_quantum, max_processes, seed, records)
+
+def run_simulation(task):
+    # Una ejecución completa con el motor por eventos. La simulación lleva sus propios
+    # flujos aleatorios sembrados, así que el resultado no depende del reparto entre procesos.
+    # Los tiempos son ticks enteros: se devuelve cuántas veces aparece cada valor, así que lo
+    # que viaja entre procesos y lo que acumula el lote depende de los valores distintos, no
+    # del número de procesos, y los percentiles del lote siguen siendo exactos.
+    completed = prepare_simulation(task).run()
+    return (Counter(process.turnaround_time for process in completed),
+            Counter(process.waiting_time for process in completed))
+
+def run_summary(task):
+    # Como run_simulation, pero devuelve solo el resumen de la ejecución: lo que viaja entre
+    # procesos no crece con el número de procesos simulados
+    simulation = prepare_simulation(task)
+    completed = simulation.run()
+    return {
+        "completed": len(completed),
+        "makespan": simulation.current_time,
+        "throughput": len(completed) / simulation.current_time if simulation.current_time else 0.0,
+        "turnaround": summarize([process.turnaround_time for process in completed]),
+        "waiting": summarize([process.waiting_time for process in completed]),
+        "response": summarize([process.response_time for process in completed]),
+    }
+
+def percentile(sorted_values, p):
+    # Percentil con interpolación lineal entre rangos vecinos
+    if not sorted_values:
+        return None
+    position = (len(sorted_values) - 1) * p / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+def summarize_counts(counts):
+    # Igual que summarize() sobre la lista con cada valor repetido tantas veces como indica
+    # `counts`, sin construirla: el valor de cada rango se busca en las frecuencias acumuladas
+    values = sorted(counts)
+    cumulative = list(accumulate(counts[value] for value in values))
+    total = cumulative[-1] if cumulative else 0
+    summary = {"mean": sum(value * counts[value] for value in values) / total if total else None}
+    for p in PERCENTILES:
+        if not total:
+            summary[f"p{p}"] = None
+            continue
+        position = (total - 1) * p / 100
+        lower = int(position)
+        upper = min(lower + 1, total - 1)
+        lower_value = values[bisect_right(cumulative, lower)]
+        upper_value = values[bisect_right(cumulative, upper)]
+        summary[f"p{p}"] = lower_value + (upper_value - lower_value) * (position - lower)
+    return summary
+
+def summarize(values):
+    values = sorted(values)
+    summary = {"mean": sum(values) / len(values) if values else None}
+    for p in PERCENTILES:
+        summary[f"p{p}"] = percentile(values, p)
+    return summary
+
+def batch_key(configuration, runs, base_seed, workload):
+    simulator, time_quantum, max_processes = configuration
+    return cache_key("batch", simulator, list(time_quantum), max_processes, runs, base_seed, workload)
+
+def run_batch(configurations, runs, base_seed=0, workers=None, workload=None, cache=None):
+    # configurations: tuplas (simulador, quantums, número de procesos). Todas las
+    # configuraciones usan las mismas semillas para que las comparaciones sean pareadas.
+    # workload: argumentos opcionales de carga.generate_workload(), p. ej.
+    # {"arrivals": "poisson", "bursts": "lognormal"}; sin él se usa el sorteo por tick.
+    # cache: ResultCache opcional; solo se simulan las configuraciones que no estén en ella.
+    summaries = {}
+    pending = []
+    for simulator, time_quantum, max_processes in configurations:
+        configuration = (simulator, tuple(time_quantum), max_processes)
+        cached = cache.get(batch_key(configuration, runs, base_seed, workload)) if cache is not None else None
+        if cached is not None:
+            summaries[configuration] = cached
+        else:
+            pending.append(configuration)
+
+    if pending:
+        tasks = [(simulator, time_quantum, max_processes, base_seed + run, workload)
+                 for simulator, time_quantum, max_processes in pending
+                 for run in range(runs)]
+        workers = workers or os.cpu_count()
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with Pool(workers) as pool:
+            results = pool.map(run_simulation, tasks, chunksize=chunksize)
+
+        for index, configuration in enumerate(pending):
+            turnaround_counts = Counter()
+            waiting_counts = Counter()
+            for turnarounds, waitings in results[index * runs:(index + 1) * runs]:
+                turnaround_counts.update(turnarounds)
+                waiting_counts.update(waitings)
+            summaries[configuration] = {
+                "runs": runs,
+                "processes": sum(turnaround_counts.values()),
+                "turnaround": summarize_counts(turnaround_counts),
+                "waiting": summarize_counts(waiting_counts),
+            }
+            if cache is not None:
+                cache.put(batch_key(configuration, runs, base_seed, workload), summaries[configuration])
+    # Mismo orden que `configurations`, vengan o no de la caché
+    return {(simulator, tuple(time_quantum), max_processes):
+            summaries[(simulator, tuple(time_quantum), max_processes)]
+            for simulator, time_quantum, max_processes in configurations}
+
+if __name__ == "__main__":
+    configurations = [("MultilevelFeedbackQueue", (q0, q1, float('inf')), 1000)
+                      for q0, q1 in [(2, 4), (4, 8), (8, 16)]]
+    for configuration, summary in run_batch(configurations, runs=200, cache=ResultCache()).items():
+        print(configuration, summary)
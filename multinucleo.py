@@ -0,0 +1,258 @@
+import argparse
+import heapq
+import random
+import time
+
+from planificador import MultilevelFeedbackQueue
+
+# Modo multinúcleo (SMP). Varios núcleos ejecutan procesos a la vez con las mismas colas
+# multinivel, quantums y políticas que el simulador de un núcleo, en uno de tres modos:
+#   shared: todos los núcleos comparten los niveles de la MLFQ.
+#   stealing: cada núcleo tiene sus propios niveles; el que se queda sin trabajo roba un
+#       proceso a otro núcleo cargado (el más cargado de dos elegidos al azar).
+#   partitioned: colas por núcleo sin robo, para comparar el desequilibrio.
+# El motor es por eventos: un montículo con el fin de la porción de cada núcleo ocupado y
+# otro con los núcleos ociosos, así que cada evento cuesta O(log núcleos) y nunca se
+# recorren todos los núcleos ni las colas. Un núcleo solo está ocioso si no le queda nada
+# que ejecutar (en shared y stealing, si no hay ningún proceso esperando), de modo que las
+# llegadas van directas a un núcleo ocioso si lo hay. Con un núcleo el resultado es idéntico
+# al de MultilevelFeedbackQueue. Las políticas expropiativas no se admiten en este modo.
+
+SHARED = "shared"
+STEALING = "stealing"
+PARTITIONED = "partitioned"
+MODES = (SHARED, STEALING, PARTITIONED)
+
+class Core:
+    __slots__ = ("index", "queues", "queued", "loaded_position", "process", "slice_start",
+                 "busy_time", "dispatches", "migrations")
+
+    def __init__(self, index, queues=None):
+        self.index = index
+        # Colas locales por nivel (None en el modo shared) y número de procesos en ellas
+        self.queues = queues
+        self.queued = 0
+        self.loaded_position = None
+        self.process = None
+        self.slice_start = 0
+        self.busy_time = 0
+        self.dispatches = 0
+        self.migrations = 0
+
+class MultiCoreFeedbackQueue(MultilevelFeedbackQueue):
+    def __init__(self, num_cores, num_queues, time_quantum, max_processes, seed=None, workload=None,
+                 sink=None, completed_window=None, track_metrics=False, policies=None, mode=SHARED):
+        super().__init__(num_queues, time_quantum, max_processes, seed, workload, sink,
+                         completed_window, track_metrics, policies)
+        if mode not in MODES:
+            raise ValueError(f"Modo multinúcleo desconocido: {mode}")
+        if num_cores < 1:
+            raise ValueError("Se necesita al menos un núcleo")
+        if any(self.preemptive):
+            raise ValueError("El modo multinúcleo no admite políticas expropiativas")
+        self.mode = mode
+        self.cores = [Core(index, None if mode == SHARED else
+                           [policy.create_queue(self.scheduling_rng) for policy in self.policies])
+                      for index in range(num_cores)]
+        self.events = []  # (fin de la porción, índice del núcleo), uno por núcleo ocupado
+        self.idle = list(range(num_cores))  # Montículo: se usa primero el de menor índice
+        self.loaded = []  # Núcleos con procesos en su cola local (solo con robo)
+        self.queued = 0
+        self.next_core = 0
+        self.migrations = 0
+        self.steals = 0
+        self.core_rng = random.Random(None if seed is None else f"{seed}:nucleos")
+
+    def enqueue(self, level, process):
+        # Solo llega aquí un proceso nuevo: si hay un núcleo ocioso lo ejecuta enseguida y,
+        # si no, espera en la cola compartida o, por turnos, en la de un núcleo. Incluso con
+        # un núcleo ocioso pasa por la cola, para que la política haga sus sorteos igual que
+        # en el simulador de un núcleo.
+        idle_core = self.cores[heapq.heappop(self.idle)] if self.idle else None
+        if self.mode == SHARED:
+            self.queues[level].append(process)
+            self.queued += 1
+        elif idle_core is not None:
+            self.enqueue_local(idle_core, level, process)
+        else:
+            self.enqueue_local(self.cores[self.next_core], level, process)
+            self.next_core = (self.next_core + 1) % len(self.cores)
+        if idle_core is not None:
+            self.schedule(idle_core)
+
+    def enqueue_local(self, core, level, process):
+        core.queues[level].append(process)
+        core.queued += 1
+        self.queued += 1
+        if core.queued == 1 and self.mode == STEALING:
+            core.loaded_position = len(self.loaded)
+            self.loaded.append(core.index)
+
+    def take_local(self, core):
+        for queue in core.queues:
+            if queue:
+                core.queued -= 1
+                self.queued -= 1
+                if core.queued == 0 and self.mode == STEALING:
+                    # Se saca de la lista de cargados intercambiándolo con el último
+                    last = self.cores[self.loaded[-1]]
+                    self.loaded[core.loaded_position] = last.index
+                    last.loaded_position = core.loaded_position
+                    self.loaded.pop()
+                    core.loaded_position = None
+                return queue.popleft()
+        return None
+
+    def take_shared(self):
+        for queue in self.queues:
+            if queue:
+                self.queued -= 1
+                return queue.popleft()
+        return None
+
+    def steal(self):
+        # Dos candidatos al azar entre los núcleos cargados; se roba al que tenga más
+        # procesos el primero que ejecutaría
+        if not self.loaded:
+            return None
+        victim = self.cores[self.core_rng.choice(self.loaded)]
+        other = self.cores[self.core_rng.choice(self.loaded)]
+        if other.queued > victim.queued:
+            victim = other
+        self.steals += 1
+        return self.take_local(victim)
+
+    def dispatch(self, core, process):
+        if process.last_core is not None and process.last_core != core.index:
+            self.migrations += 1
+            core.migrations += 1
+        process.last_core = core.index
+        if process.start_time is None:
+            process.start_time = self.current_time
+        core.process = process
+        core.slice_start = self.current_time
+        core.dispatches += 1
+        ticks = min(process.remaining_time, self.time_quantum[process.current_queue])
+        heapq.heappush(self.events, (self.current_time + ticks, core.index))
+
+    def schedule(self, core):
+        if self.mode == SHARED:
+            process = self.take_shared()
+        elif core.queued:
+            process = self.take_local(core)
+        elif self.mode == STEALING:
+            process = self.steal()
+        else:
+            process = None
+        if process is None:
+            heapq.heappush(self.idle, core.index)
+        else:
+            self.dispatch(core, process)
+
+    def end_slice(self, core):
+        # Fin de la porción: el proceso termina o ha agotado el quantum y baja de nivel
+        process = core.process
+        elapsed = self.current_time - core.slice_start
+        process.remaining_time -= elapsed
+        core.busy_time += elapsed
+        core.process = None
+        if process.remaining_time == 0:
+            self.complete_process(process)
+        else:
+            if process.current_queue < self.num_queues - 1:
+                process.current_queue += 1
+            if self.mode == SHARED:
+                self.queues[process.current_queue].append(process)
+                self.queued += 1
+            else:
+                self.enqueue_local(core, process.current_queue, process)
+        self.schedule(core)
+
+    def update(self):
+        # Un tick: primero las llegadas y después los núcleos cuya porción acaba ahora, en
+        # orden de índice (con un núcleo, el mismo orden que el simulador de un núcleo)
+        if self.is_paused:
+            return
+        self.generate_process()
+        events = self.events
+        while events and events[0][0] <= self.current_time:
+            self.end_slice(self.cores[heapq.heappop(events)[1]])
+        self.current_time += 1
+
+    def is_finished(self):
+        return not self.events and not self.queued and self.next_arrival_time() is None
+
+    def advance(self):
+        # Salta a la próxima llegada o fin de porción, lo que ocurra antes
+        if self.is_paused or self.is_finished():
+            return False
+        arrival_time = self.next_arrival_time()
+        if self.events and (arrival_time is None or self.events[0][0] < arrival_time):
+            event_time = self.events[0][0]
+        else:
+            event_time = arrival_time
+        self.current_time = max(self.current_time, event_time)
+        self.update()
+        return True
+
+    def core_report(self):
+        # Utilización por núcleo (fracción del tiempo simulado ocupado), migraciones (un
+        # proceso que vuelve a ejecutarse en otro núcleo), robos y desequilibrio de carga
+        # (tiempo ocupado del núcleo más cargado respecto a la media, menos uno)
+        busy = [core.busy_time + (self.current_time - core.slice_start if core.process else 0)
+                for core in self.cores]
+        utilization = [busy_time / self.current_time if self.current_time else 0.0 for busy_time in busy]
+        mean_busy = sum(busy) / len(busy)
+        return {
+            "mode": self.mode,
+            "cores": len(self.cores),
+            "time": self.current_time,
+            "completed": self.completed_count,
+            "utilization": utilization,
+            "mean_utilization": sum(utilization) / len(utilization),
+            "dispatches": [core.dispatches for core in self.cores],
+            "core_migrations": [core.migrations for core in self.cores],
+            "migrations": self.migrations,
+            "steals": self.steals,
+            "load_imbalance": max(busy) / mean_busy - 1 if mean_busy else 0.0,
+        }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulación multinúcleo sin interfaz")
+    parser.add_argument("--cores", type=int, default=32)
+    parser.add_argument("--mode", choices=MODES, default=SHARED)
+    parser.add_argument("--processes", type=int, default=100_000)
+    parser.add_argument("--quantum", nargs="+", default=["4", "8", "inf"],
+                        help="quantum de cada nivel (inf en el último para no degradar más)")
+    parser.add_argument("--load", type=float, default=0.9,
+                        help="carga ofrecida por núcleo: fija la tasa de llegadas de Poisson")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    # Carga pre-generada con NumPy (solo se importa si se usa)
+    import carga
+    time_quantum = [float('inf') if text == "inf" else int(text) for text in args.quantum]
+    # Ráfagas uniformes 5..50 (media 27,5 ticks), como el generador por ticks
+    rate = args.load * args.cores / 27.5
+    workload = carga.workload_records(*carga.generate_workload(
+        args.processes, "poisson", "uniform", args.seed, arrival_params={"rate": rate}))
+    simulation = MultiCoreFeedbackQueue(args.cores, len(time_quantum), time_quantum, args.processes,
+                                        args.seed, workload, mode=args.mode)
+    start = time.perf_counter()
+    completed = simulation.run()
+    elapsed = time.perf_counter() - start
+
+    report = simulation.core_report()
+    utilization = report["utilization"]
+    print(f"{report['cores']} núcleos ({report['mode']}), {report['completed']} procesos en "
+          f"{report['time']} ticks ({elapsed:.2f} s)")
+    print(f"utilización: media {report['mean_utilization']:.1%}, mínima {min(utilization):.1%}, "
+          f"máxima {max(utilization):.1%}")
+    print(f"migraciones: {report['migrations']}, robos: {report['steals']}, "
+          f"desequilibrio: {report['load_imbalance']:.1%}")
+    if completed:
+        print(f"retorno medio: {sum(p.turnaround_time for p in completed) / len(completed):.1f}, "
+              f"espera media: {sum(p.waiting_time for p in completed) / len(completed):.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import json
+import time
+from collections import deque
+from itertools import islice
+
+# Perfilado opcional por fases. Cada iteración (un frame de la interfaz o un paso del hilo
+# de simulación) se divide en fases con mark() y se guarda como un registro en un anillo
+# de tamaño fijo. Si no hay perfilador, el código instrumentado solo comprueba un None.
+
+FRAME_PHASES = ("events", "draw", "table", "overlay", "flip", "wait")
+STEP_PHASES = ("commands", "update", "snapshot", "checkpoint")
+
+class PhaseRecorder:
+    # Registro: (inicio, duración, ticks, tiempo de cada fase), todo en segundos
+    def __init__(self, phases, capacity=600):
+        self.phases = phases
+        self.index = {phase: i for i, phase in enumerate(phases)}
+        self.records = deque(maxlen=capacity)
+        self.current = None
+        self.start_time = 0.0
+        self.last_time = 0.0
+
+    def begin(self):
+        self.start_time = self.last_time = time.perf_counter()
+        self.current = [0.0] * len(self.phases)
+
+    def mark(self, phase):
+        # Atribuye a `phase` el tiempo transcurrido desde la marca anterior
+        now = time.perf_counter()
+        self.current[self.index[phase]] += now - self.last_time
+        self.last_time = now
+
+    def end(self, ticks=0):
+        self.records.append((self.start_time, self.last_time - self.start_time, ticks, *self.current))
+
+    def recent(self, count):
+        # copy() es atómica, así que se puede leer mientras otro hilo sigue añadiendo
+        return list(islice(reversed(self.records.copy()), count))
+
+    def means(self, count):
+        records = self.recent(count)
+        if not records:
+            return None
+        columns = list(zip(*records))
+        means = {"duration": sum(columns[1]) / len(records), "ticks": sum(columns[2]) / len(records)}
+        for phase, values in zip(self.phases, columns[3:]):
+            means[phase] = sum(values) / len(records)
+        return means
+
+    def rows(self):
+        columns = ("start", "duration", "ticks") + self.phases
+        return [dict(zip(columns, record)) for record in self.records.copy()]
+
+class Profiler:
+    def __init__(self, capacity=600):
+        self.frames = PhaseRecorder(FRAME_PHASES, capacity)
+        self.steps = PhaseRecorder(STEP_PHASES, capacity)
+
+    def summary(self, count=60):
+        frame = self.frames.means(count)
+        return {
+            "fps": 1 / frame["duration"] if frame and frame["duration"] else 0.0,
+            "frame": frame,
+            "step": self.steps.means(count),
+        }
+
+    def export(self, path):
+        with open(path, "w") as file:
+            json.dump({
+                "units": "s",
+                "summary": self.summary(self.frames.records.maxlen),
+                "frames": self.frames.rows(),
+                "steps": self.steps.rows(),
+            }, file, indent=1)
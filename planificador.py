@@ -0,0 +1,327 @@
+import itertools
+import random
+from collections import deque, namedtuple
+from operator import attrgetter
+
+from estadisticas import RemainingTimeHistogram, SimulationMetrics
+from politicas import FirstComeFirstServed, RoundRobin, ShortestJobFirst
+
+# Colores de los procesos (solo cosméticos, el modelo no depende de ellos)
+PROCESS_COLORS = [(255, 99, 71), (50, 205, 50), (65, 105, 225), (255, 215, 0), (218, 112, 214),
+                  (0, 206, 209), (255, 105, 180), (154, 205, 50), (255, 140, 0), (138, 43, 226)]
+
+# Copias inmutables del estado que se publican para la interfaz. Las colas solo incluyen
+# los primeros procesos visibles. completed_processes es una copia de la ventana de
+# completados recientes o, si no hay ventana, la lista del modelo, de la que solo se deben
+# leer los primeros completed_rows elementos (solo crece por el final).
+ProcessSnapshot = namedtuple("ProcessSnapshot", "pid arrival_time burst_time remaining_time current_queue color")
+SimulationSnapshot = namedtuple("SimulationSnapshot", "current_time queues queue_lengths current_process "
+                                "total_processes_generated max_processes completed_processes completed_rows "
+                                "completed_count is_paused metrics queue_summaries")
+
+VISIBLE_PROCESSES = 8
+
+class Process:
+    # Solo estado de planificación, sin __dict__: la posición en pantalla la calcula la
+    # interfaz y los tiempos de retorno y espera se derivan del de finalización.
+    __slots__ = ("pid", "arrival_time", "burst_time", "remaining_time", "current_queue",
+                 "color", "start_time", "completion_time", "priority", "deadline", "last_core")
+
+    def __init__(self, pid, arrival_time, burst_time, color=None, priority=0, deadline=None):
+        self.pid = pid
+        self.arrival_time = arrival_time
+        self.burst_time = burst_time
+        self.remaining_time = burst_time
+        self.current_queue = 0
+        self.color = color if color is not None else PROCESS_COLORS[pid % len(PROCESS_COLORS)]
+        self.start_time = None
+        self.completion_time = None
+        # Solo los usan las políticas de prioridad, lotería y EDF (ver politicas.py)
+        self.priority = priority
+        self.deadline = deadline
+        # Último núcleo en el que se ejecutó (solo en el modo multinúcleo, ver multinucleo.py)
+        self.last_core = None
+
+    def __reduce__(self):
+        # Serialización compacta para los puntos de control: una tupla por proceso
+        return (unpack_process, (process_fields(self),))
+
+    @property
+    def turnaround_time(self):
+        if self.completion_time is None:
+            return None
+        return self.completion_time - self.arrival_time
+
+    @property
+    def response_time(self):
+        if self.start_time is None:
+            return None
+        return self.start_time - self.arrival_time
+
+    @property
+    def waiting_time(self):
+        if self.completion_time is None:
+            return None
+        return self.completion_time - self.arrival_time - self.burst_time
+
+    def snapshot(self):
+        return ProcessSnapshot(self.pid, self.arrival_time, self.burst_time, self.remaining_time,
+                               self.current_queue, self.color)
+
+process_fields = attrgetter(*Process.__slots__)
+
+def unpack_process(fields, new=Process.__new__):
+    process = new(Process)
+    (process.pid, process.arrival_time, process.burst_time, process.remaining_time,
+     process.current_queue, process.color, process.start_time, process.completion_time,
+     process.priority, process.deadline, process.last_core) = fields
+    return process
+
+# Las colas se serializan como listas de tuplas extraídas con attrgetter, mucho más rápido
+# que dejar que pickle llame a __reduce__ proceso a proceso
+def pack_processes(processes):
+    return list(map(process_fields, processes))
+
+def unpack_processes(rows):
+    return list(map(unpack_process, rows))
+
+class MultilevelFeedbackQueue:
+    # Cada nivel tiene un quantum (time_quantum) y una política (politicas.py) que decide
+    # el orden de su cola; por defecto todos los niveles son Round Robin.
+    def __init__(self, num_queues, time_quantum, max_processes, seed=None, workload=None,
+                 sink=None, completed_window=None, track_metrics=False, policies=None,
+                 track_queues=False):
+        if policies is None:
+            policies = [RoundRobin() for _ in range(num_queues)]
+        if len(policies) != num_queues or len(time_quantum) != num_queues:
+            raise ValueError("Se necesita una política y un quantum por cada cola")
+        if any(quantum < 1 for quantum in time_quantum):
+            # advance() cuenta con porciones de al menos un tick
+            raise ValueError("Los quantums deben ser al menos 1")
+        self.num_queues = num_queues
+        self.policies = list(policies)
+        self.preemptive = [policy.preemptive for policy in self.policies]
+        self.time_quantum = time_quantum
+        self.current_time = 0
+        # Con completed_window solo se guardan los últimos completados en memoria; el
+        # historial completo va al sumidero (ver sumideros.py), si lo hay
+        self.completed_processes = [] if completed_window is None else deque(maxlen=completed_window)
+        self.completed_count = 0
+        self.sink = sink
+        # Estadísticas en flujo (media, varianza y percentiles) por cola y en global. Son
+        # opcionales porque multiplican el coste por completado en las ejecuciones por lotes.
+        self.metrics = SimulationMetrics(num_queues) if track_metrics else None
+        # Histograma del tiempo restante de cada cola, mantenido al encolar y desencolar,
+        # para que la interfaz pueda resumir colas de cualquier longitud (también opcional)
+        self.queue_histograms = [RemainingTimeHistogram() for _ in range(num_queues)] if track_queues else None
+        self.current_process = None
+        self.time_in_current_queue = 0
+        self.next_pid = 1
+        self.total_processes_generated = 0
+        self.max_processes = max_processes
+        self.pending_process = None
+        self.arrival_clock = 0
+        self.is_paused = False
+        # Flujos aleatorios independientes para llegadas, ráfagas y colores: con la misma
+        # semilla la carga es idéntica, y cambiar algo cosmético no altera la simulación.
+        self.seed = seed
+        self.arrival_rng = random.Random(None if seed is None else f"{seed}:llegadas")
+        self.burst_rng = random.Random(None if seed is None else f"{seed}:rafagas")
+        self.cosmetic_rng = random.Random(None if seed is None else f"{seed}:colores")
+        # Prioridad y plazo de cada proceso (solo se sortean si alguna política los usa) y
+        # sorteos de las políticas, p. ej. la lotería
+        self.draw_attributes = any(policy.uses_attributes for policy in self.policies)
+        self.attribute_rng = random.Random(None if seed is None else f"{seed}:atributos")
+        self.scheduling_rng = random.Random(None if seed is None else f"{seed}:planificacion")
+        self.queues = [policy.create_queue(self.scheduling_rng) for policy in self.policies]
+        # Flujo opcional de pares (llegada, ráfaga) ordenado por llegada que sustituye al
+        # sorteo por tick, por ejemplo una carga pre-generada con carga.generate_workload()
+        self.workload = iter(workload) if workload is not None else None
+        self.workload_position = 0
+
+    def next_arrival_time(self):
+        # Sortea por adelantado la próxima llegada. Se consumen los mismos números
+        # aleatorios y en el mismo orden que un sorteo por tick, así que el bucle por
+        # ticks y el motor por eventos dan el mismo resultado.
+        if self.pending_process is None and self.total_processes_generated < self.max_processes:
+            if self.workload is not None:
+                record = next(self.workload, None)
+                if record is None:
+                    return None
+                self.workload_position += 1
+                arrival_time, burst_time = record
+            else:
+                arrival_time = self.arrival_clock
+                while self.arrival_rng.random() >= 0.1:
+                    arrival_time += 1
+                self.arrival_clock = arrival_time + 1
+                burst_time = self.burst_rng.randint(5, 50)
+            color = self.cosmetic_rng.choice(PROCESS_COLORS)
+            if self.draw_attributes:
+                priority = int(self.attribute_rng.random() * 10)
+                deadline = arrival_time + burst_time * (2 + int(self.attribute_rng.random() * 5))
+                self.pending_process = Process(self.next_pid, arrival_time, burst_time, color, priority, deadline)
+            else:
+                self.pending_process = Process(self.next_pid, arrival_time, burst_time, color)
+        return self.pending_process.arrival_time if self.pending_process else None
+
+    def generate_process(self):
+        # Con una carga externa pueden llegar varios procesos en el mismo tick
+        arrival_time = self.next_arrival_time()
+        while arrival_time is not None and arrival_time <= self.current_time:
+            self.enqueue(0, self.pending_process)
+            self.pending_process = None
+            self.next_pid += 1
+            self.total_processes_generated += 1
+            arrival_time = self.next_arrival_time()
+
+    def enqueue(self, level, process):
+        self.queues[level].append(process)
+        if self.queue_histograms is not None:
+            self.queue_histograms[level].add(process.remaining_time)
+
+    def select_process(self):
+        for queue in self.queues:
+            if queue:
+                process = queue.popleft()
+                if self.queue_histograms is not None:
+                    self.queue_histograms[process.current_queue].remove(process.remaining_time)
+                return process
+        return None
+
+    def update(self):
+        if self.is_paused:
+            return
+
+        self.generate_process()
+
+        if self.current_process:
+            process = self.current_process
+            process.remaining_time -= 1
+            self.time_in_current_queue += 1
+            level = process.current_queue
+
+            if process.remaining_time == 0:
+                self.complete_process(process)
+                self.current_process = None
+                self.time_in_current_queue = 0
+            elif self.time_in_current_queue >= self.time_quantum[level]:
+                if level < len(self.queues) - 1:
+                    process.current_queue += 1
+                self.enqueue(process.current_queue, process)
+                self.current_process = None
+                self.time_in_current_queue = 0
+            elif (self.preemptive[level] and self.queues[level]
+                  and self.policies[level].preempts(self.queues[level], process)):
+                # Expropiación dentro del nivel: vuelve a su cola sin bajar de nivel
+                self.enqueue(level, process)
+                self.current_process = None
+                self.time_in_current_queue = 0
+
+        if not self.current_process:
+            self.current_process = self.select_process()
+            self.time_in_current_queue = 0
+            if self.current_process and self.current_process.start_time is None:
+                self.current_process.start_time = self.current_time
+
+        self.current_time += 1
+
+    def complete_process(self, process):
+        process.completion_time = self.current_time
+        self.completed_processes.append(process)
+        self.completed_count += 1
+        if self.metrics is not None:
+            self.metrics.record(process)
+        if self.sink is not None:
+            self.sink.write(process)
+
+    def is_finished(self):
+        return (self.current_process is None and not any(self.queues)
+                and self.next_arrival_time() is None)
+
+    def advance(self):
+        # Salta directamente al siguiente evento (llegada, fin de quantum o finalización)
+        # y lo ejecuta con update(), dejando el mismo estado que la secuencia de ticks.
+        if self.is_paused or self.is_finished():
+            return False
+
+        if self.current_process:
+            process = self.current_process
+            ticks = min(process.remaining_time,
+                        self.time_quantum[process.current_queue] - self.time_in_current_queue)
+            start_time = self.current_time
+            event_time = start_time + ticks - 1
+            arrival_time = self.next_arrival_time()
+            if self.preemptive[process.current_queue]:
+                # Una llegada puede expropiar al proceso: también es un evento
+                if arrival_time is not None and arrival_time < event_time:
+                    event_time = arrival_time
+            else:
+                # Sin expropiación las llegadas intermedias solo se encolan
+                while arrival_time is not None and arrival_time < event_time:
+                    self.current_time = arrival_time
+                    self.generate_process()
+                    arrival_time = self.next_arrival_time()
+            elapsed = event_time - start_time
+            process.remaining_time -= elapsed
+            self.time_in_current_queue += elapsed
+            self.current_time = event_time
+        elif not any(self.queues):
+            # CPU ociosa: saltar hasta la próxima llegada
+            self.current_time = max(self.current_time, self.next_arrival_time())
+
+        self.update()
+        return True
+
+    def run(self):
+        while self.advance():
+            pass
+        if self.sink is not None:
+            self.sink.flush()
+        return self.completed_processes
+
+    def __getstate__(self):
+        # El sumidero y el flujo de carga no se pueden serializar: al restaurar se vuelven a
+        # conectar (ver puntos_control.py) y la carga se reanuda en workload_position
+        state = self.__dict__.copy()
+        state["sink"] = None
+        state["has_workload"] = self.workload is not None
+        state["workload"] = None
+        state["queues"] = [pack_processes(queue) if isinstance(queue, deque) else queue
+                           for queue in self.queues]
+        state["completed_processes"] = (getattr(self.completed_processes, "maxlen", None),
+                                        pack_processes(self.completed_processes))
+        return state
+
+    def __setstate__(self, state):
+        state["queues"] = [deque(unpack_processes(queue)) if isinstance(queue, list) else queue
+                           for queue in state["queues"]]
+        completed_window, rows = state["completed_processes"]
+        completed = unpack_processes(rows)
+        state["completed_processes"] = completed if completed_window is None else deque(completed, completed_window)
+        self.__dict__.update(state)
+
+    def snapshot(self):
+        return SimulationSnapshot(
+            self.current_time,
+            tuple(tuple(process.snapshot() for process in itertools.islice(queue, VISIBLE_PROCESSES))
+                  for queue in self.queues),
+            tuple(len(queue) for queue in self.queues),
+            self.current_process.snapshot() if self.current_process else None,
+            self.total_processes_generated,
+            self.max_processes,
+            self.completed_processes if isinstance(self.completed_processes, list) else tuple(self.completed_processes),
+            len(self.completed_processes),
+            self.completed_count,
+            self.is_paused,
+            self.metrics.summary(self.current_time) if self.metrics is not None else None,
+            tuple(histogram.summary() for histogram in self.queue_histograms)
+            if self.queue_histograms is not None else None,
+        )
+
+class MultiQueueMultiAlgorithm(MultilevelFeedbackQueue):
+    def __init__(self, time_quantum, max_processes, seed=None, workload=None,
+                 sink=None, completed_window=None, track_metrics=False, track_queues=False):
+        super().__init__(3, time_quantum, max_processes, seed, workload, sink, completed_window,
+                         track_metrics, [RoundRobin(), ShortestJobFirst(), FirstComeFirstServed()],
+                         track_queues)
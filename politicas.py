@@ -0,0 +1,174 @@
+import heapq
+from collections import deque
+from operator import attrgetter
+
+# Políticas de planificación por nivel. Cada nivel de la simulación se configura con una
+# política, que crea la estructura de datos de su cola y decide si el proceso en ejecución
+# cede la CPU a uno recién encolado en su mismo nivel. Todas las colas ofrecen la misma
+# interfaz (append, popleft, len e iteración), así que el motor no distingue entre ellas.
+# El quantum de cada nivel se sigue configurando aparte, en time_quantum.
+
+class KeyedQueue:
+    # Montículo ordenado por key(proceso): inserción y extracción del menor en O(log n).
+    # Los empates se resuelven por orden de entrada en la cola, como una cola FIFO.
+    def __init__(self, key):
+        self.key = key
+        self.heap = []
+        self.counter = 0
+
+    def append(self, process):
+        heapq.heappush(self.heap, (self.key(process), self.counter, process))
+        self.counter += 1
+
+    def popleft(self):
+        return heapq.heappop(self.heap)[2]
+
+    def peek_key(self):
+        return self.heap[0][0]
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __iter__(self):
+        return (entry[2] for entry in self.heap)
+
+    def __getstate__(self):
+        # Importación diferida: planificador importa este módulo al cargarse
+        from planificador import pack_processes
+        return (self.key, self.counter, [entry[:2] for entry in self.heap],
+                pack_processes(entry[2] for entry in self.heap))
+
+    def __setstate__(self, state):
+        from planificador import unpack_processes
+        self.key, self.counter, keys, rows = state
+        self.heap = [(key, order, process)
+                     for (key, order), process in zip(keys, unpack_processes(rows))]
+
+class ShortestJobQueue(KeyedQueue):
+    def __init__(self):
+        super().__init__(attrgetter("remaining_time"))
+
+    def append(self, process):
+        # Igual que KeyedQueue.append, sin la llamada a la función clave (camino caliente)
+        heapq.heappush(self.heap, (process.remaining_time, self.counter, process))
+        self.counter += 1
+
+def priority_tickets(process):
+    # Prioridad 0 (la más alta) -> 10 boletos; prioridad 9 -> 1 boleto
+    return 10 - process.priority
+
+class LotteryQueue:
+    # Sorteo ponderado por boletos. Los procesos se agrupan por número de boletos, de modo
+    # que el sorteo solo recorre los grupos (pocos) y la extracción dentro del grupo es
+    # O(1), intercambiando el elegido con el último.
+    def __init__(self, rng, tickets=priority_tickets):
+        self.rng = rng
+        self.tickets = tickets
+        self.groups = {}
+        self.total_tickets = 0
+        self.length = 0
+
+    def append(self, process):
+        tickets = self.tickets(process)
+        self.groups.setdefault(tickets, []).append(process)
+        self.total_tickets += tickets
+        self.length += 1
+
+    def popleft(self):
+        draw = self.rng.randrange(self.total_tickets)
+        for tickets, group in self.groups.items():
+            weight = tickets * len(group)
+            if draw < weight:
+                break
+            draw -= weight
+        index = draw // tickets
+        group[index], group[-1] = group[-1], group[index]
+        process = group.pop()
+        if not group:
+            del self.groups[tickets]
+        self.total_tickets -= tickets
+        self.length -= 1
+        return process
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        return (process for group in self.groups.values() for process in group)
+
+class Policy:
+    name = ""
+    preemptive = False
+    # Si usa la prioridad o el plazo de los procesos (si ninguna política los usa, no se sortean)
+    uses_attributes = False
+
+    def create_queue(self, rng):
+        return deque()
+
+    def preempts(self, queue, process):
+        # Solo se consulta si la política es expropiativa y la cola no está vacía
+        return False
+
+class RoundRobin(Policy):
+    name = "Round Robin"
+
+class FirstComeFirstServed(Policy):
+    name = "First Come First Served"
+
+class KeyedPolicy(Policy):
+    # Elige el proceso con menor key(proceso); si es expropiativa, el que se ejecuta cede
+    # la CPU cuando llega a su nivel uno con una clave estrictamente menor
+    key = None
+
+    def create_queue(self, rng):
+        return KeyedQueue(self.key)
+
+    def preempts(self, queue, process):
+        return queue.peek_key() < self.key(process)
+
+class ShortestJobFirst(KeyedPolicy):
+    name = "Shortest Job First"
+    key = attrgetter("remaining_time")
+
+    def create_queue(self, rng):
+        return ShortestJobQueue()
+
+class ShortestRemainingTimeFirst(ShortestJobFirst):
+    name = "Shortest Remaining Time First"
+    preemptive = True
+
+class PriorityScheduling(KeyedPolicy):
+    name = "Prioridad"
+    key = attrgetter("priority")
+    uses_attributes = True
+
+    def __init__(self, preemptive=False):
+        self.preemptive = preemptive
+
+class EarliestDeadlineFirst(KeyedPolicy):
+    name = "Earliest Deadline First"
+    key = attrgetter("deadline")
+    preemptive = True
+    uses_attributes = True
+
+class Lottery(Policy):
+    name = "Lotería"
+    uses_attributes = True
+
+    def create_queue(self, rng):
+        return LotteryQueue(rng)
+
+POLICIES = {
+    "rr": RoundRobin,
+    "fcfs": FirstComeFirstServed,
+    "sjf": ShortestJobFirst,
+    "srtf": ShortestRemainingTimeFirst,
+    "priority": PriorityScheduling,
+    "lottery": Lottery,
+    "edf": EarliestDeadlineFirst,
+}
+
+def create_policy(name):
+    if name not in POLICIES:
+        raise ValueError(f"Política desconocida: {name}")
+    return POLICIES[name]()
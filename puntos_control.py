@@ -0,0 +1,103 @@
+import gc
+import hashlib
+import io
+import itertools
+import os
+import pickle
+from contextlib import contextmanager
+
+# Puntos de control de una simulación: todo el estado del planificador (colas, proceso
+# actual, time_in_current_queue, contadores, estadísticas y estado de los generadores
+# aleatorios) se guarda en binario con pickle y se puede reanudar o bifurcar después.
+
+# Se sube al cambiar la forma del fichero (la cabecera o lo que se guarda tras ella)
+CHECKPOINT_FORMAT = 1
+# Módulos que definen las clases guardadas en un punto de control (modelo, políticas,
+# estadísticas, núcleos y las vistas de la interfaz): si cambia cualquiera de ellos, los
+# puntos de control anteriores dejan de ser válidos
+CHECKPOINT_FILES = ("planificador.py", "politicas.py", "estadisticas.py", "multinucleo.py", "Pruebassss.py")
+
+_checkpoint_version = None
+
+def checkpoint_version():
+    global _checkpoint_version
+    if _checkpoint_version is None:
+        digest = hashlib.sha256()
+        root = os.path.dirname(os.path.abspath(__file__))
+        for name in CHECKPOINT_FILES:
+            with open(os.path.join(root, name), "rb") as source:
+                digest.update(name.encode())
+                digest.update(source.read())
+        _checkpoint_version = digest.hexdigest()
+    return _checkpoint_version
+
+@contextmanager
+def gc_paused():
+    # Con millones de procesos el recolector cíclico se dispara una y otra vez mientras se
+    # crean objetos que no forman ciclos; pausarlo acelera mucho la restauración
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+def checkpoint_header():
+    # Formato del fichero y versión de las clases guardadas: un punto de control solo se
+    # reanuda con el mismo código que lo escribió
+    return (CHECKPOINT_FORMAT, checkpoint_version())
+
+def read_checkpoint(stream, name):
+    # pickle puede fallar con casi cualquier excepción si el contenido no es el esperado
+    # (p. ej. un Process con otros campos), así que todo se informa como ValueError
+    try:
+        header = pickle.load(stream)
+    except Exception as error:
+        raise ValueError(f"{name}: punto de control no válido ({error})") from error
+    if header != checkpoint_header():
+        raise ValueError(f"{name}: punto de control de otra versión del simulador")
+    try:
+        return pickle.load(stream)
+    except Exception as error:
+        raise ValueError(f"{name}: punto de control no válido ({error})") from error
+
+def dumps_checkpoint(simulation):
+    with gc_paused():
+        return (pickle.dumps(checkpoint_header(), protocol=pickle.HIGHEST_PROTOCOL)
+                + pickle.dumps(simulation, protocol=pickle.HIGHEST_PROTOCOL))
+
+def loads_checkpoint(data, workload=None, sink=None):
+    with gc_paused():
+        simulation = read_checkpoint(io.BytesIO(data), "punto de control")
+    reattach(simulation, workload, sink)
+    return simulation
+
+def save_checkpoint(simulation, path):
+    # Escritura atómica: nunca queda un punto de control a medias
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as checkpoint, gc_paused():
+        pickle.dump(checkpoint_header(), checkpoint, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(simulation, checkpoint, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary_path, path)
+
+def load_checkpoint(path, workload=None, sink=None):
+    with open(path, "rb") as checkpoint, gc_paused():
+        simulation = read_checkpoint(checkpoint, path)
+    reattach(simulation, workload, sink)
+    return simulation
+
+def reattach(simulation, workload, sink):
+    # Si la simulación consumía una carga externa hay que volver a pasarla desde el
+    # principio; se saltan los registros que ya se habían leído
+    has_workload = simulation.__dict__.pop("has_workload", False)
+    if has_workload:
+        if workload is None:
+            raise ValueError("La simulación usaba una carga externa: hay que pasarla para reanudarla")
+        simulation.workload = itertools.islice(workload, simulation.workload_position, None)
+    simulation.sink = sink
+    return simulation
+
+def fork(simulation, workload=None, sink=None):
+    # Copia independiente para explorar otra rama desde el mismo estado
+    return loads_checkpoint(dumps_checkpoint(simulation), workload, sink)
@@ -1,14 +1,11 @@
+import itertools
 import pygame
-import random
 import sys
-
-# Inicializar Pygame
-pygame.init()
+import planificador
+from dibujo import get_queue_background, render_text
 
 # Configuración de la pantalla
 WIDTH, HEIGHT = 1200, 800
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Simulador de Colas Multinivel con Retroalimentación")
 
 # Colores
 BACKGROUND = (15, 15, 30)
@@ -16,84 +13,35 @@ WHITE = (255, 255, 255)
 GRAY = (100, 100, 100)
 HIGHLIGHT = (70, 130, 180)
 RED = (255, 0, 0)
-PROCESS_COLORS = [(255, 99, 71), (50, 205, 50), (65, 105, 225), (255, 215, 0), (218, 112, 214),
-                  (0, 206, 209), (255, 105, 180), (154, 205, 50), (255, 140, 0), (138, 43, 226)]
-
-# Fuentes
-font = pygame.font.Font(None, 24)
-title_font = pygame.font.Font(None, 36)
-
-class Process:
-    def __init__(self, pid, arrival_time, burst_time):
-        self.pid = pid
-        self.arrival_time = arrival_time
-        self.burst_time = burst_time
-        self.remaining_time = burst_time
-        self.current_queue = 0
-        self.x = 0
-        self.y = 0
-        self.color = random.choice(PROCESS_COLORS)
-        self.completion_time = None
-        self.turnaround_time = None
-        self.waiting_time = None
-
-class MultilevelFeedbackQueue:
-    def __init__(self, num_queues, time_quantum, max_processes):
-        self.num_queues = num_queues
-        self.queues = [[] for _ in range(num_queues)]
-        self.time_quantum = time_quantum
-        self.current_time = 0
-        self.completed_processes = []
-        self.current_process = None
-        self.time_in_current_queue = 0
-        self.next_pid = 1
-        self.total_processes_generated = 0
-        self.max_processes = max_processes
+
+# Procesos completados que la interfaz conserva en memoria para la tabla
+COMPLETED_WINDOW = 1000
+
+# Pantalla y fuentes: se crean en init_display() al arrancar la interfaz, no al importar
+screen = None
+font = None
+title_font = None
+
+def init_display():
+    global screen, font, title_font
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Simulador de Colas Multinivel con Retroalimentación")
+    font = pygame.font.Font(None, 24)
+    title_font = pygame.font.Font(None, 36)
+    return screen
+
+class MultilevelFeedbackQueue(planificador.MultilevelFeedbackQueue):
+    def __init__(self, num_queues, time_quantum, max_processes, seed=None, sink=None):
+        super().__init__(num_queues, time_quantum, max_processes, seed, sink=sink,
+                         completed_window=COMPLETED_WINDOW)
         self.show_completed = False
         self.scroll_offset = 0
         self.max_scroll = 0
 
-    def generate_process(self):
-        if self.total_processes_generated < self.max_processes and random.random() < 0.1:
-            burst_time = random.randint(5, 50)
-            new_process = Process(self.next_pid, self.current_time, burst_time)
-            self.queues[0].append(new_process)
-            self.next_pid += 1
-            self.total_processes_generated += 1
-
-    def update(self):
-        self.generate_process()
-
-        if self.current_process:
-            self.current_process.remaining_time -= 1
-            self.time_in_current_queue += 1
-            
-            if self.current_process.remaining_time == 0:
-                self.current_process.completion_time = self.current_time
-                self.current_process.turnaround_time = self.current_time - self.current_process.arrival_time
-                self.current_process.waiting_time = self.current_process.turnaround_time - self.current_process.burst_time
-                self.completed_processes.append(self.current_process)
-                self.current_process = None
-                self.time_in_current_queue = 0
-            elif self.time_in_current_queue >= self.time_quantum[self.current_process.current_queue]:
-                if self.current_process.current_queue < self.num_queues - 1:
-                    self.current_process.current_queue += 1
-                self.queues[self.current_process.current_queue].append(self.current_process)
-                self.current_process = None
-                self.time_in_current_queue = 0
-
-        if not self.current_process:
-            for q in range(self.num_queues):
-                if self.queues[q]:
-                    self.current_process = self.queues[q].pop(0)
-                    self.time_in_current_queue = 0
-                    break
-
-        self.current_time += 1
-
     def draw(self, screen):
         # Dibujar título
-        title = title_font.render("Simulador de Colas Multinivel con Retroalimentación", True, WHITE)
+        title = render_text(title_font, "Simulador de Colas Multinivel con Retroalimentación", WHITE)
         screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 20))
 
         queue_height = (HEIGHT - 300) // self.num_queues
@@ -101,26 +49,23 @@ class MultilevelFeedbackQueue:
 
         for i, queue in enumerate(self.queues):
             y_pos = start_y + i * (queue_height + 20)
-            # Dibujar fondo de la cola con gradiente
-            for j in range(queue_height):
-                alpha = 100 + (155 * j // queue_height)
-                pygame.draw.rect(screen, (*HIGHLIGHT[:3], alpha), (50, y_pos + j, WIDTH - 100, 1))
-            
+            # Dibujar fondo de la cola con gradiente (pre-renderizado)
+            screen.blit(get_queue_background(WIDTH - 100, queue_height), (50, y_pos))
+
             # Borde de la cola
             pygame.draw.rect(screen, WHITE, (50, y_pos, WIDTH - 100, queue_height), 2)
             
             # Etiqueta de la cola (dentro del recuadro)
-            text = font.render(f"Cola {i}: Quantum = {self.time_quantum[i]}", True, WHITE)
+            text = render_text(font, f"Cola {i}: Quantum = {self.time_quantum[i]}", WHITE)
             screen.blit(text, (60, y_pos + 10))
 
-            visible_processes = queue[:min(len(queue), 8)]
+            visible_processes = itertools.islice(queue, 8)
             for j, process in enumerate(visible_processes):
-                process.x = 60 + j * 135
-                process.y = y_pos + 40
-                self.draw_process(screen, process, is_current=(process == self.current_process))
+                self.draw_process(screen, process, 60 + j * 135, y_pos + 40,
+                                  is_current=(process == self.current_process))
 
             if len(queue) > 8:
-                text = font.render(f"+{len(queue) - 8} más", True, WHITE)
+                text = render_text(font, f"+{len(queue) - 8} más", WHITE)
                 screen.blit(text, (WIDTH - 150, y_pos + queue_height // 2))
 
         if self.current_process:
@@ -134,10 +79,10 @@ class MultilevelFeedbackQueue:
         info_text = [
             f"Tiempo: {self.current_time}",
             f"Procesos generados: {self.total_processes_generated}/{self.max_processes}",
-            f"Procesos completados: {len(self.completed_processes)}"
+            f"Procesos completados: {self.completed_count}"
         ]
         for i, text in enumerate(info_text):
-            rendered_text = font.render(text, True, WHITE)
+            rendered_text = render_text(font, text, WHITE)
             screen.blit(rendered_text, (info_rect.x + 10 + i * (info_rect.width // 3), info_rect.y + 20))
 
         # Dibujar botón para mostrar procesos completados
@@ -147,11 +92,11 @@ class MultilevelFeedbackQueue:
         if self.show_completed:
             self.draw_completed_processes(screen)
 
-    def draw_process(self, screen, process, is_current=False, bottom=False):
+    def draw_process(self, screen, process, x=0, y=0, is_current=False, bottom=False):
         bar_width = 120
         bar_height = 30
-        x = process.x if not bottom else WIDTH // 2 - bar_width // 2
-        y = process.y if not bottom else HEIGHT - 100
+        x = x if not bottom else WIDTH // 2 - bar_width // 2
+        y = y if not bottom else HEIGHT - 100
 
         # Dibujar barra de progreso con efecto de brillo
         progress = (process.burst_time - process.remaining_time) / process.burst_time
@@ -165,7 +110,7 @@ class MultilevelFeedbackQueue:
         pygame.draw.rect(screen, WHITE, (x, y, bar_width, bar_height), 1)
         
         # Texto del proceso
-        text = font.render(f"P{process.pid}: {process.remaining_time}", True, WHITE)
+        text = render_text(font, f"P{process.pid}: {process.remaining_time}", WHITE)
         screen.blit(text, (x + 5, y + bar_height // 2 - text.get_height() // 2))
         
         if is_current and not bottom:
@@ -174,15 +119,15 @@ class MultilevelFeedbackQueue:
         
         if bottom:
             # Información adicional para el proceso actual en la parte inferior
-            text = font.render("Proceso en ejecución", True, WHITE)
+            text = render_text(font, "Proceso en ejecución", WHITE)
             screen.blit(text, (x, y - 60))
-            text = font.render(f"Cola: {process.current_queue}", True, WHITE)
+            text = render_text(font, f"Cola: {process.current_queue}", WHITE)
             screen.blit(text, (x, y - 30))
 
     def draw_completed_button(self, screen):
         button_rect = pygame.Rect(WIDTH - 280, HEIGHT - 120, 230, 30)
         pygame.draw.rect(screen, HIGHLIGHT, button_rect, border_radius=5)
-        text = font.render("Ver Procesos Completados", True, WHITE)
+        text = render_text(font, "Ver Procesos Completados", WHITE)
         text_rect = text.get_rect(center=button_rect.center)
         screen.blit(text, text_rect)
         return button_rect
@@ -192,55 +137,61 @@ class MultilevelFeedbackQueue:
         pygame.draw.rect(screen, GRAY, window_rect)
         pygame.draw.rect(screen, WHITE, window_rect, 2)
 
-        title = font.render("Procesos Completados", True, WHITE)
+        rows = len(self.completed_processes)
+        title_text = "Procesos Completados"
+        if rows < self.completed_count:
+            title_text += f" (últimos {rows} de {self.completed_count})"
+        title = render_text(font, title_text, WHITE)
         screen.blit(title, (window_rect.x + 10, window_rect.y + 10))
 
-        # Crear una superficie para el contenido con scroll
-        content_height = max(window_rect.height - 50, len(self.completed_processes) * 30 + 40)
-        content_surface = pygame.Surface((window_rect.width - 20, content_height))
-        content_surface.fill(GRAY)
+        # Área con scroll debajo del título
+        view_rect = pygame.Rect(window_rect.x + 10, window_rect.y + 40, window_rect.width - 20, window_rect.height - 50)
+        content_height = max(view_rect.height, rows * 30 + 40)
+
+        previous_clip = screen.get_clip()
+        screen.set_clip(view_rect)
 
         # Dibujar encabezados de columna
         headers = ["PID", "Llegada", "Ráfaga", "Finalización", "Retorno", "Espera"]
         header_widths = [50, 70, 70, 100, 70, 70]
-        x_offset = 10
+        x_offset = view_rect.x + 10
         for header, width in zip(headers, header_widths):
-            text = font.render(header, True, WHITE)
-            content_surface.blit(text, (x_offset, 10))
+            text = render_text(font, header, WHITE)
+            screen.blit(text, (x_offset, view_rect.y + 10))
             x_offset += width
 
         # Dibujar línea separadora
-        pygame.draw.line(content_surface, WHITE, (10, 35), (window_rect.width - 30, 35), 2)
-
-        # Dibujar datos de procesos
-        for i, process in enumerate(self.completed_processes):
-            y_pos = i * 30 + 40 - self.scroll_offset
-            if 0 <= y_pos < content_height:
-                x_offset = 10
-                data = [
-                    str(process.pid),
-                    str(process.arrival_time),
-                    str(process.burst_time),
-                    str(process.completion_time),
-                    str(process.turnaround_time),
-                    str(process.waiting_time)
-                ]
-                for value, width in zip(data, header_widths):
-                    text = font.render(value, True, WHITE)
-                    content_surface.blit(text, (x_offset, y_pos))
-                    x_offset += width
-
-        # Dibujar la superficie de contenido en la ventana
-        screen.blit(content_surface, (window_rect.x + 10, window_rect.y + 40), 
-                    (0, 0, window_rect.width - 20, window_rect.height - 50))
+        pygame.draw.line(screen, WHITE, (view_rect.x + 10, view_rect.y + 35), (window_rect.right - 20, view_rect.y + 35), 2)
+
+        # Tabla virtualizada: solo se dibujan las filas dentro de la ventana visible, así que
+        # el coste por frame no depende de cuántos procesos se hayan completado
+        first_row = max(0, -(-(self.scroll_offset - 40) // 30))
+        last_row = min(rows, (self.scroll_offset + view_rect.height - 40) // 30 + 1)
+        visible_processes = itertools.islice(self.completed_processes, first_row, last_row)
+        for i, process in enumerate(visible_processes, first_row):
+            y_pos = view_rect.y + i * 30 + 40 - self.scroll_offset
+            x_offset = view_rect.x + 10
+            data = [
+                str(process.pid),
+                str(process.arrival_time),
+                str(process.burst_time),
+                str(process.completion_time),
+                str(process.turnaround_time),
+                str(process.waiting_time)
+            ]
+            for value, width in zip(data, header_widths):
+                text = render_text(font, value, WHITE)
+                screen.blit(text, (x_offset, y_pos))
+                x_offset += width
+        screen.set_clip(previous_clip)
 
         # Dibujar la barra de desplazamiento
-        if content_height > window_rect.height - 50:
-            scroll_height = (window_rect.height - 50) * (window_rect.height - 50) / content_height
-            scroll_pos = (window_rect.height - 50 - scroll_height) * self.scroll_offset / (content_height - window_rect.height + 50)
-            pygame.draw.rect(screen, WHITE, (window_rect.right - 20, window_rect.y + 40 + scroll_pos, 10, scroll_height))
+        if content_height > view_rect.height:
+            scroll_height = view_rect.height * view_rect.height / content_height
+            scroll_pos = (view_rect.height - scroll_height) * self.scroll_offset / (content_height - view_rect.height)
+            pygame.draw.rect(screen, WHITE, (window_rect.right - 20, view_rect.y + scroll_pos, 10, scroll_height))
 
-        self.max_scroll = max(0, content_height - window_rect.height + 50)
+        self.max_scroll = max(0, content_height - view_rect.height)
 
     def handle_scroll(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -251,13 +202,13 @@ class MultilevelFeedbackQueue:
 
 def draw_menu(screen):
     screen.fill(BACKGROUND)
-    title = title_font.render("Configuración de la Simulación", True, WHITE)
+    title = render_text(title_font, "Configuración de la Simulación", WHITE)
     screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 100))
 
     input_boxes = []
     labels = ["Quantum para Cola 0:", "Quantum para Cola 1:", "Número de Procesos:"]
     for i, label in enumerate(labels):
-        text = font.render(label, True, WHITE)
+        text = render_text(font, label, WHITE)
         screen.blit(text, (WIDTH // 2 - 200, 200 + i * 60))
         input_box = pygame.Rect(WIDTH // 2 + 50, 195 + i * 60, 100, 32)
         pygame.draw.rect(screen, WHITE, input_box, 2)
@@ -265,7 +216,7 @@ def draw_menu(screen):
 
     start_button = pygame.Rect(WIDTH // 2 - 50, 420, 100, 40)
     pygame.draw.rect(screen, HIGHLIGHT, start_button)
-    start_text = font.render("Iniciar", True, WHITE)
+    start_text = render_text(font, "Iniciar", WHITE)
     screen.blit(start_text, (start_button.x + 25, start_button.y + 10))
 
     return input_boxes, start_button
@@ -288,10 +239,12 @@ def get_simulation_parameters():
                         q1 = int(input_values[0])
                         q2 = int(input_values[1])
                         num_processes = int(input_values[2])
-                        if q1 <= q2 and num_processes > 0:
+                        if 0 < q1 <= q2 and num_processes > 0:
                             return [q1, q2, float('inf')], num_processes
                         else:
-                            if q1 > q2:
+                            if q1 < 1:
+                                error_message = "Los quantums deben ser positivos."
+                            elif q1 > q2:
                                 error_message = "El quantum de la Cola 0 debe ser menor o igual al de la Cola 1."
                             else:
                                 error_message = "El número de procesos debe ser positivo."
@@ -311,12 +264,12 @@ def get_simulation_parameters():
         screen.fill(BACKGROUND)
         input_boxes, start_button = draw_menu(screen)
         for i, box in enumerate(input_boxes):
-            txt_surface = font.render(input_values[i], True, WHITE)
+            txt_surface = render_text(font, input_values[i], WHITE)
             screen.blit(txt_surface, (box.x + 5, box.y + 5))
             pygame.draw.rect(screen, HIGHLIGHT if i == active_box else WHITE, box, 2)
 
         if error_message:
-            error_text = font.render(error_message, True, RED)
+            error_text = render_text(font, error_message, RED)
             screen.blit(error_text, (WIDTH // 2 - error_text.get_width() // 2, 480))
 
         pygame.display.flip()
@@ -366,14 +319,14 @@ def main():
         button_rect = pygame.Rect(WIDTH - 110, 10, 100, 40)
         button_color = HIGHLIGHT if button_rect.collidepoint(mouse_pos) else GRAY
         pygame.draw.rect(screen, button_color, button_rect, border_radius=5)
-        text = font.render("Play/Pause", True, WHITE)
+        text = render_text(font, "Play/Pause", WHITE)
         screen.blit(text, (WIDTH - 100, 20))
 
         # Dibujar botón de reinicio
         restart_button_rect = pygame.Rect(WIDTH - 110, 60, 100, 40)
         restart_button_color = HIGHLIGHT if restart_button_rect.collidepoint(mouse_pos) else GRAY
         pygame.draw.rect(screen, restart_button_color, restart_button_rect, border_radius=5)
-        restart_text = font.render("Reiniciar", True, WHITE)
+        restart_text = render_text(font, "Reiniciar", WHITE)
         screen.blit(restart_text, (WIDTH - 100, 70))
 
         pygame.display.flip()
@@ -383,5 +336,6 @@ def main():
     sys.exit()
 
 if __name__ == "__main__":
+    init_display()
     while True:
         main()
\ No newline at end of file
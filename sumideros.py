@@ -0,0 +1,98 @@
+import csv
+import json
+
+# Destinos para los procesos completados. Las filas se acumulan en un búfer y se
+# escriben por lotes, así que la memoria no crece con la duración de la simulación.
+
+COLUMNS = ("pid", "arrival_time", "burst_time", "completion_time", "turnaround_time", "waiting_time")
+
+def process_row(process):
+    return (process.pid, process.arrival_time, process.burst_time,
+            process.completion_time, process.turnaround_time, process.waiting_time)
+
+class CompletionSink:
+    def __init__(self, batch_size=10000):
+        self.batch_size = batch_size
+        self.buffer = []
+        self.rows_written = 0
+
+    def write(self, process):
+        self.buffer.append(process_row(process))
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.write_batch(self.buffer)
+            self.rows_written += len(self.buffer)
+            self.buffer = []
+
+    def write_batch(self, rows):
+        raise NotImplementedError
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class CSVSink(CompletionSink):
+    def __init__(self, path, batch_size=10000):
+        super().__init__(batch_size)
+        self.file = open(path, "w", newline="")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(COLUMNS)
+
+    def write_batch(self, rows):
+        self.writer.writerows(rows)
+
+    def close(self):
+        super().close()
+        self.file.close()
+
+class JSONLinesSink(CompletionSink):
+    def __init__(self, path, batch_size=10000):
+        super().__init__(batch_size)
+        self.file = open(path, "w")
+
+    def write_batch(self, rows):
+        self.file.write("".join(json.dumps(dict(zip(COLUMNS, row))) + "\n" for row in rows))
+
+    def close(self):
+        super().close()
+        self.file.close()
+
+class ParquetSink(CompletionSink):
+    # Formato columnar: cada lote se escribe como un row group de Parquet (requiere pyarrow)
+    def __init__(self, path, batch_size=100000):
+        super().__init__(batch_size)
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        self.pa = pa
+        self.schema = pa.schema([(column, pa.int64()) for column in COLUMNS])
+        self.writer = pq.ParquetWriter(path, self.schema)
+
+    def write_batch(self, rows):
+        columns = [self.pa.array(column, type=self.pa.int64()) for column in zip(*rows)]
+        self.writer.write_table(self.pa.Table.from_arrays(columns, schema=self.schema))
+
+    def close(self):
+        super().close()
+        self.writer.close()
+
+SINKS = {
+    "csv": CSVSink,
+    "jsonl": JSONLinesSink,
+    "parquet": ParquetSink,
+}
+
+def open_sink(path, batch_size=None):
+    # Elige el destino por la extensión del fichero
+    extension = path.rsplit(".", 1)[-1].lower()
+    if extension not in SINKS:
+        raise ValueError(f"Formato de salida no soportado: {path}")
+    sink_class = SINKS[extension]
+    return sink_class(path) if batch_size is None else sink_class(path, batch_size)
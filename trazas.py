@@ -0,0 +1,71 @@
+import mmap
+import struct
+
+# Reproducción de cargas grabadas. Las trazas se leen en flujo, registro a registro, así
+# que la memoria no depende del tamaño del fichero. El resultado se pasa como `workload`
+# a MultilevelFeedbackQueue o MultiQueueMultiAlgorithm.
+#
+# Formatos:
+#   texto (.csv, .txt): una línea "llegada,ráfaga" (o separada por espacios) por proceso;
+#       se ignoran las líneas vacías, los comentarios con '#' y una cabecera no numérica.
+#   binario (.bin): pares de enteros int64 little-endian (llegada, ráfaga), leídos con mmap.
+
+RECORD = struct.Struct("<qq")
+CHUNK_SIZE = RECORD.size * 65536
+
+def read_text_trace(path):
+    with open(path, "r", buffering=1 << 20) as trace:
+        last_arrival = None
+        header_seen = False
+        for line_number, line in enumerate(trace, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            fields = line.replace(",", " ").split()
+            try:
+                arrival_time, burst_time = int(fields[0]), int(fields[1])
+            except (ValueError, IndexError):
+                if last_arrival is None and not header_seen:
+                    # Cabecera: la primera línea con contenido, aunque la precedan
+                    # comentarios o líneas vacías
+                    header_seen = True
+                    continue
+                raise ValueError(f"{path}:{line_number}: registro no válido: {line!r}")
+            if arrival_time < 0 or burst_time < 1:
+                raise ValueError(f"{path}:{line_number}: llegada negativa o ráfaga menor que 1: {line!r}")
+            if last_arrival is not None and arrival_time < last_arrival:
+                raise ValueError(f"{path}:{line_number}: la traza debe estar ordenada por llegada")
+            last_arrival = arrival_time
+            yield arrival_time, burst_time
+
+def read_binary_trace(path):
+    with open(path, "rb") as trace:
+        if not trace.seek(0, 2):
+            return
+        with mmap.mmap(trace.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if len(mapped) % RECORD.size:
+                raise ValueError(f"{path}: tamaño no múltiplo de {RECORD.size} bytes")
+            # Se decodifica por bloques copiados del mapa para no mantener exportado su
+            # búfer mientras el generador está suspendido
+            last_arrival = None
+            index = 0
+            for offset in range(0, len(mapped), CHUNK_SIZE):
+                for arrival_time, burst_time in RECORD.iter_unpack(mapped[offset:offset + CHUNK_SIZE]):
+                    if arrival_time < 0 or burst_time < 1:
+                        raise ValueError(f"{path}: registro {index}: llegada negativa o ráfaga menor que 1")
+                    if last_arrival is not None and arrival_time < last_arrival:
+                        raise ValueError(f"{path}: registro {index}: la traza debe estar ordenada por llegada")
+                    last_arrival = arrival_time
+                    index += 1
+                    yield arrival_time, burst_time
+
+def read_trace(path):
+    if path.lower().endswith(".bin"):
+        return read_binary_trace(path)
+    return read_text_trace(path)
+
+def write_binary_trace(path, records):
+    # Convierte cualquier flujo (llegada, ráfaga) al formato binario, p. ej. una traza de texto
+    with open(path, "wb", buffering=1 << 20) as trace:
+        for arrival_time, burst_time in records:
+            trace.write(RECORD.pack(arrival_time, burst_time))